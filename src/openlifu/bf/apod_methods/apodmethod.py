@@ -1,5 +1,7 @@
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
+from typing import Sequence
+import numpy as np
 import xarray as xa
 from openlifu.xdc import Transducer
 from openlifu.geo import Point
@@ -11,6 +13,9 @@ class ApodizationMethod(ABC):
     def calc_apodization(self, arr: Transducer, target: Point, params: xa.Dataset, transform: bool = True):
         pass
 
+    def calc_apodization_batch(self, arr: Transducer, targets: Sequence[Point], params: xa.Dataset, transform: bool = True):
+        return np.stack([self.calc_apodization(arr, target, params, transform=transform) for target in targets])
+
     def to_dict(self):
         d = self.__dict__.copy()
         d['class'] = self.__class__.__name__
@@ -1,7 +1,9 @@
 from dataclasses import dataclass
 import xarray as xa
 import numpy as np
+from typing import Sequence
 from openlifu.xdc import Transducer
+from openlifu.util.units import getunitconversion
 from openlifu.geo import Point
 from openlifu.bf.apod_methods import ApodizationMethod
 
@@ -10,9 +12,14 @@ class MaxAngle(ApodizationMethod):
     max_angle: float = 30.0
     units: str = "deg"
     def calc_apodization(self, arr: Transducer, target: Point, params: xa.Dataset, transform: bool = True):
-        target_pos = target.get_position(units="m")
-        matrix = arr.get_matrix(units="m") if transform else np.eye(4)
-        angles = np.array([el.angle_to_point(target_pos, units="m", matrix=matrix, return_as=self.units) for el in arr.elements])
-        apod = np.zeros(arr.numelements())
-        apod[angles <= self.max_angle] = 1
+        return self.calc_apodization_batch(arr, [target], params, transform=transform)[0]
+
+    def calc_apodization_batch(self, arr: Transducer, targets: Sequence[Point], params: xa.Dataset, transform: bool = True):
+        target_pos = np.array([target.get_position(units="m") for target in targets]).reshape(-1, 3)
+        v1 = target_pos[:, None, :] - arr.get_positions(transform=transform, units="m")[None, :, :]
+        v2 = arr.get_normals(transform=transform)[None, :, :]
+        # Element angles are arcsin(|v1 x v2|) in [0, pi/2], so compare sines instead of inverting them
+        sin_angles = np.linalg.norm(np.cross(v1, v2), axis=2) / (np.linalg.norm(v1, axis=2) * np.linalg.norm(v2, axis=2))
+        max_angle = min(self.max_angle * getunitconversion(self.units, "rad"), np.pi/2)
+        apod = (sin_angles <= np.sin(max_angle)).astype(np.float32)
         return apod
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 import xarray as xa
 import numpy as np
+from typing import Sequence
 from openlifu.xdc import Transducer
 from openlifu.geo import Point
 from openlifu.bf.apod_methods import ApodizationMethod
@@ -9,4 +10,7 @@ from openlifu.bf.apod_methods import ApodizationMethod
 class Uniform(ApodizationMethod):
     value = 1
     def calc_apodization(self, arr: Transducer, target: Point, params: xa.Dataset, transform: bool = True):
-        return np.full(arr.numelements(), self.value)
+        return np.full(arr.numelements(), self.value, dtype=np.float32)
+
+    def calc_apodization_batch(self, arr: Transducer, targets: Sequence[Point], params: xa.Dataset, transform: bool = True):
+        return np.full((len(targets), arr.numelements()), self.value, dtype=np.float32)
@@ -1,5 +1,7 @@
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
+from typing import Sequence
+import numpy as np
 import xarray as xa
 from openlifu.xdc import Transducer
 from openlifu.geo import Point
@@ -11,6 +13,9 @@ class DelayMethod(ABC):
     def calc_delays(self, arr: Transducer, target: Point, params: xa.Dataset, transform: bool = True):
         pass
 
+    def calc_delays_batch(self, arr: Transducer, targets: Sequence[Point], params: xa.Dataset, transform: bool = True):
+        return np.stack([self.calc_delays(arr, target, params, transform=transform) for target in targets])
+
     def to_dict(self):
         d = self.__dict__.copy()
         d['class'] = self.__class__.__name__
@@ -4,19 +4,22 @@ import numpy as np
 from openlifu.xdc import Transducer
 from openlifu.geo import Point
 from openlifu.bf.delay_methods import DelayMethod
-from typing import ClassVar, Optional
+from typing import ClassVar, Optional, Sequence
 
 @dataclass
 class Direct(DelayMethod):
     c0: float = 1480.0
     def calc_delays(self, arr: Transducer, target: Point, params: Optional[xa.Dataset]=None, transform: bool = True):
+        return self.calc_delays_batch(arr, [target], params, transform=transform)[0]
+
+    def calc_delays_batch(self, arr: Transducer, targets: Sequence[Point], params: Optional[xa.Dataset]=None, transform: bool = True):
         if params is None:
             c = self.c0
         else:
             c = params['sound_speed'].attrs['ref_value']
-        target_pos = target.get_position(units="m")
-        matrix = arr.get_matrix(units="m") if transform else np.eye(4)
-        dists = np.array([el.distance_to_point(target_pos, units="m", matrix=matrix) for el in arr.elements])
+        target_pos = np.array([target.get_position(units="m") for target in targets]).reshape(-1, 3)
+        positions = arr.get_positions(transform=transform, units="m")
+        dists = np.linalg.norm(positions[None, :, :] - target_pos[:, None, :], axis=2)
         tof = dists / c
-        delays = max(tof) - tof
+        delays = (tof.max(axis=1, keepdims=True) - tof).astype(np.float32)
         return delays
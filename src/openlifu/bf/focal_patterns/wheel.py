@@ -33,13 +33,17 @@ class Wheel(FocalPattern):
         else:
             targets = []
         m = target.get_matrix(center_on_point=True)
+        thetas = 2*np.pi*np.arange(self.num_spokes)/self.num_spokes
+        local_positions = np.stack([self.spoke_radius*np.cos(thetas),
+                                    self.spoke_radius*np.sin(thetas),
+                                    np.zeros(self.num_spokes),
+                                    np.ones(self.num_spokes)], axis=1)
+        positions = np.dot(local_positions, m.T)[:, :3]
+        angles = np.rad2deg(thetas)
         for i in range(self.num_spokes):
-            theta = 2*np.pi*i/self.num_spokes
-            local_position = self.spoke_radius * np.array([np.cos(theta), np.sin(theta), 0.0])
-            position = np.dot(m, np.append(local_position, 1.0))[:3]
-            spoke = Point(id=f"{target.id}_{np.rad2deg(theta):.0f}deg",
-                              name=f"{target.name} ({np.rad2deg(theta):.0f}°)",
-                              position=position,
+            spoke = Point(id=f"{target.id}_{angles[i]:.0f}deg",
+                              name=f"{target.name} ({angles[i]:.0f}°)",
+                              position=positions[i],
                               units=self.units,
                               radius=target.radius)
             targets.append(spoke)
@@ -1,6 +1,13 @@
 import numpy as np
 import pandas as pd
 from dataclasses import dataclass
+from functools import lru_cache
+
+@lru_cache(maxsize=16)
+def _time_vector(duration: float, dt: float):
+    t = np.arange(0, duration, dt)
+    t.flags.writeable = False
+    return t
 
 @dataclass
 class Pulse:
@@ -23,16 +30,20 @@ class Pulse:
         :param t: Array of times to calculate the pulse at (s)
         :returns: Array of pulse values at the given times
         """
-        return self.amplitude * np.sin(2*np.pi*self.frequency*t)
+        y = np.sin(2*np.pi*self.frequency*t)
+        y *= self.amplitude
+        return y
 
     def calc_time(self, dt: float):
         """
         Calculate the time array for the pulse for a particular timestep
 
+        The array is cached per duration and time step, and is read-only.
+
         :param dt: Time step (s)
         :returns: Array of times for the pulse (s)
         """
-        return np.arange(0, self.duration, dt)
+        return _time_vector(self.duration, dt)
 
     def get_table(self):
         """
@@ -1,4 +1,6 @@
 from dataclasses import dataclass, field
+from functools import lru_cache
+import hashlib
 from typing import Tuple, Optional, List, Dict, Literal
 from openlifu.util.units import getunitconversion
 import numpy as np
@@ -37,7 +39,10 @@ ADDRESSES_GLOBAL = [ADDRESS_GLOBAL_MODE,
                     ADDRESS_APODIZATION]
 ADDRESSES_DELAY_DATA = [i for i in range(0x20, 0x11F+1)]
 ADDRESSES_PATTERN_DATA = [i for i in range(0x120, 0x19F+1)]
-ADDRESSES = ADDRESSES_GLOBAL + ADDRESSES_DELAY_DATA + ADDRESSES_PATTERN_DATA
+ADDRESSES = tuple(ADDRESSES_GLOBAL + ADDRESSES_DELAY_DATA + ADDRESSES_PATTERN_DATA)
+_GLOBAL_TEMPLATE = dict.fromkeys(ADDRESSES_GLOBAL, 0x0)
+_DELAY_DATA_TEMPLATE = dict.fromkeys(ADDRESSES_DELAY_DATA, 0x0)
+_PATTERN_DATA_TEMPLATE = dict.fromkeys(ADDRESSES_PATTERN_DATA, 0x0)
 NUM_CHANNELS = 32
 MAX_REGISTER = 0x19F
 REGISTER_BYTES = 4
@@ -62,32 +67,61 @@ DELAY_CHANNEL_MAP = {}
 for row, channels in enumerate(DELAY_ORDER):
     for i, channel in enumerate(channels):
         DELAY_CHANNEL_MAP[channel] = {'row': row, 'lsb': 16*(1-i)}
+
+def _order_tables(order, lsbs):
+    """
+    Builds per-item lookup tables from a row-major layout table of 1-based item numbers
+
+    :param order: Nested list of item numbers, one list per register row
+    :param lsbs: Least significant bit of each column
+    :returns: Read-only arrays of the row and least significant bit of each item, indexed by item number - 1
+    """
+    order = np.asarray(order) - 1
+    rows = np.empty(order.size, dtype=np.int64)
+    lsb = np.empty(order.size, dtype=np.int64)
+    rows[order] = np.arange(order.shape[0])[:, None]
+    lsb[order] = lsbs
+    rows.flags.writeable = False
+    lsb.flags.writeable = False
+    return rows, lsb
+
+_DELAY_ROW, _DELAY_LSB = _order_tables(DELAY_ORDER, [16, 0])
 DELAY_PROFILE_OFFSET = 16
 VALID_DELAY_PROFILES = [i for i in range(1, 17)]
+_VALID_DELAY_PROFILES_SET = frozenset(VALID_DELAY_PROFILES)
 DELAY_WIDTH = 13
+_DELAY_MAX = (1 << DELAY_WIDTH) - 1
 APODIZATION_CHANNEL_ORDER = [17, 19, 21, 23, 25, 27, 29, 31, 18, 20, 22, 24, 26, 28, 30, 32, 1, 3, 5, 7, 9, 11, 13, 15, 2, 4, 6, 8, 10, 12, 14, 16]
 DEFAULT_PATTERN_DUTY_CYCLE = 0.66
 PATTERN_PROFILE_OFFSET = 4
 NUM_PATTERN_PROFILES = 32
 VALID_PATTERN_PROFILES = [i for i in range(1, NUM_PATTERN_PROFILES+1)]
+_VALID_PATTERN_PROFILES_SET = frozenset(VALID_PATTERN_PROFILES)
 MAX_PATTERN_PERIODS = 16
 PATTERN_PERIOD_ORDER = [[1, 2, 3, 4],
                  [5, 6, 7, 8],
                  [9, 10, 11, 12],
                  [13, 14, 15, 16]]
 PATTERN_LENGTH_WIDTH = 5
+_PATTERN_LENGTH_MAX = (1 << PATTERN_LENGTH_WIDTH) - 1
 MAX_PATTERN_PERIOD_LENGTH = 30
 PATTERN_LEVEL_WIDTH = 3
 PATTERN_MAP = {}
 for row, periods in enumerate(PATTERN_PERIOD_ORDER):
     for i, period in enumerate(periods):
         PATTERN_MAP[period] = {'row': row, 'lsb_lvl': i*(PATTERN_LEVEL_WIDTH+PATTERN_LENGTH_WIDTH), 'lsb_period': i*(PATTERN_LENGTH_WIDTH+PATTERN_LEVEL_WIDTH)+PATTERN_LEVEL_WIDTH}
+_PAT_ROW, _PAT_LSB_LVL = _order_tables(PATTERN_PERIOD_ORDER, np.arange(len(PATTERN_PERIOD_ORDER[0]))*(PATTERN_LEVEL_WIDTH+PATTERN_LENGTH_WIDTH))
+_PAT_LSB_PER = _PAT_LSB_LVL + PATTERN_LEVEL_WIDTH
+_PAT_LSB_PER.flags.writeable = False
+_LEVEL_LUT = np.array([0b01, 0b00, 0b10], dtype=np.int64) # indexed by level+1
+_LEVEL_LUT.flags.writeable = False
 MAX_REPEAT = 2**5-1
 MAX_ELASTIC_REPEAT = 2**16-1
 DEFAULT_TAIL_COUNT = 29
 DEFAULT_CLK_FREQ = 64e6
 ProfileOpts = Literal['active', 'configured', 'all']
 
+@lru_cache(maxsize=None)
 def get_delay_location(channel:int, profile:int=1):
     """
     Gets the address and least significant bit of a delay
@@ -98,13 +132,104 @@ def get_delay_location(channel:int, profile:int=1):
     """
     if channel not in DELAY_CHANNEL_MAP:
         raise ValueError(f"Invalid channel {channel}.")
-    channel_map = DELAY_CHANNEL_MAP[channel]
-    if profile not in VALID_DELAY_PROFILES:
+    if profile not in _VALID_DELAY_PROFILES_SET:
         raise ValueError(f"Invalid Profile {profile}")
-    address = ADDRESSES_DELAY_DATA[0] + (profile-1) * DELAY_PROFILE_OFFSET + channel_map['row']
-    lsb = channel_map['lsb']
+    address = ADDRESSES_DELAY_DATA[0] + (profile-1) * DELAY_PROFILE_OFFSET + int(_DELAY_ROW[channel-1])
+    lsb = int(_DELAY_LSB[channel-1])
     return address, lsb
 
+@lru_cache(maxsize=None)
+def _delay_data_addresses(profile:int):
+    """
+    Gets the register addresses holding the delay data of a profile, in row order
+
+    :param profile: Delay profile number
+    :returns: Tuple of register addresses
+    """
+    address = ADDRESSES_DELAY_DATA[0] + (profile-1) * DELAY_PROFILE_OFFSET
+    return tuple(range(address, address + len(DELAY_ORDER)))
+
+@lru_cache(maxsize=16)
+def _seconds_per_unit(units: str):
+    """
+    Gets the conversion factor from a time unit to seconds
+
+    :param units: Time units
+    :returns: Conversion factor to seconds
+    """
+    return getunitconversion(units, 's')
+
+def _delay_words(delays: np.ndarray, units: str, bf_clk: float):
+    """
+    Packs the delays of one or more transmitters into delay data register words
+
+    :param delays: Array of delays with one entry per channel along the last axis
+    :param units: Units of the delays
+    :param bf_clk: Clock frequency of the BF system in Hz
+    :returns: Array of register words with one entry per delay data row along the last axis
+    """
+    delay_values = (delays * _seconds_per_unit(units) * bf_clk).astype(np.int64)
+    # Negative values wrap around to large unsigned values, so one comparison checks both bounds
+    invalid = delay_values.view(np.uint64) > _DELAY_MAX
+    if np.any(invalid):
+        raise ValueError(f"Value {delay_values[invalid][0]} does not fit in {DELAY_WIDTH} bits")
+    words = np.zeros(delay_values.shape[:-1] + (len(DELAY_ORDER),), dtype=np.int64)
+    np.bitwise_or.at(words, (Ellipsis, _DELAY_ROW), delay_values << _DELAY_LSB)
+    return words
+
+def _pack_block(address: int, words: Tuple[int, ...], pack_single: bool=False):
+    """
+    Packs register words stored at contiguous addresses into a single block
+
+    Equivalent to `pack_registers` for one contiguous run of addresses, without going through a per-address dictionary.
+
+    :param address: Address of the first word
+    :param words: Register words
+    :param pack_single: Pack a single register into an array
+    :returns: Dictionary of packed registers
+    """
+    values = list(words)
+    return {address: values if (pack_single or len(values) > 1) else values[0]}
+
+def _data_registers(addresses: Tuple[int, ...], words: Tuple[int, ...], pack: bool=False, pack_single: bool=False):
+    """
+    Builds a fresh dictionary of data registers from register words
+
+    :param addresses: Contiguous addresses of the words
+    :param words: Register words
+    :param pack: Pack the registers into a single block
+    :param pack_single: Pack a single register into an array
+    :returns: Dictionary of registers
+    """
+    if pack:
+        return _pack_block(addresses[0], words, pack_single=pack_single)
+    return dict(zip(addresses, words))
+
+@lru_cache(maxsize=None)
+def _pattern_data_addresses(profile:int):
+    """
+    Gets the register addresses holding the pattern data of a profile, in row order
+
+    :param profile: Pattern profile number
+    :returns: Tuple of register addresses
+    """
+    address = ADDRESSES_PATTERN_DATA[0] + (profile-1) * PATTERN_PROFILE_OFFSET
+    return tuple(range(address, address + len(PATTERN_PERIOD_ORDER)))
+
+@lru_cache(maxsize=64)
+def _field_masks(lsb:int, width: Optional[int]):
+    """
+    Gets the masks of a register field
+
+    :param lsb: Least significant bit of the field
+    :param width: Width of the field (bits)
+    :returns: Width of the field, mask of the unshifted value and mask clearing the field in place
+    """
+    if width is None:
+        width = REGISTER_WIDTH - lsb
+    mask = (1 << width) - 1
+    return width, mask, ~(mask << lsb)
+
 def set_register_value(reg_value:int, value:int, lsb:int=0, width: Optional[int]=None):
     """
     Sets the value of a parameter in a register integer
@@ -115,12 +240,10 @@ def set_register_value(reg_value:int, value:int, lsb:int=0, width: Optional[int]
     :param width: Width of the parameter (bits)
     :returns: New register value
     """
-    if width is None:
-        width = REGISTER_WIDTH - lsb
-    mask = (1 << width) - 1
+    width, mask, clear = _field_masks(lsb, width)
     if value < 0 or value > mask:
         raise ValueError(f"Value {value} does not fit in {width} bits")
-    return (reg_value & ~(mask << lsb)) | ((int(value) & mask) << lsb)
+    return (reg_value & clear) | ((int(value) & mask) << lsb)
 
 def get_register_value(reg_value:int, lsb:int=0, width: Optional[int]=None):
     """
@@ -131,12 +254,10 @@ def get_register_value(reg_value:int, lsb:int=0, width: Optional[int]=None):
     :param width: Width of the parameter (bits)
     :returns: Value of the parameter
     """
-    if width is None:
-        width = REGISTER_WIDTH - lsb
-    mask = (1 << width) - 1
+    _, mask, _ = _field_masks(lsb, width)
     return (reg_value >> lsb) & mask
 
-def calc_pulse_pattern(frequency:float, duty_cycle:float=DEFAULT_PATTERN_DUTY_CYCLE, bf_clk:float=DEFAULT_CLK_FREQ):
+def calc_pulse_pattern(frequency:float, duty_cycle:float=DEFAULT_PATTERN_DUTY_CYCLE, bf_clk:float=DEFAULT_CLK_FREQ, with_waveform:bool=True):
     """
     Calculates the pattern for a given frequency and duty cycle
 
@@ -146,8 +267,46 @@ def calc_pulse_pattern(frequency:float, duty_cycle:float=DEFAULT_PATTERN_DUTY_CY
     :param frequency: Frequency of the pattern in Hz
     :param duty_cycle: Duty cycle of the pattern
     :param bf_clk: Clock frequency of the BF system in Hz
-    :returns: Tuple of lists of levels and lengths, and the clock divider setting
+    :param with_waveform: Include the sampled pattern waveform
+    :returns: Dictionary of the lists of levels and lengths, the clock divider setting, and, if requested, the lists of sampled pattern times ('t') and levels ('y')
+    """
+    levels, lengths, clk_div_n, warnings = _calc_pulse_pattern(frequency, duty_cycle, bf_clk)
+    # The pattern is cached, so log its warnings here to repeat them on every call
+    for message in warnings:
+        logging.warning(message)
+    pattern = {'levels': list(levels),
+               'lengths': list(lengths),
+               'clk_div_n': clk_div_n}
+    if with_waveform:
+        t, y = _pulse_pattern_waveform(frequency, duty_cycle, bf_clk)
+        pattern['t'], pattern['y'] = list(t), list(y)
+    return pattern
+
+def _split_samples(samples:int):
+    """
+    Splits a run of samples at one level into pattern period lengths
+
+    Each period lasts its length plus 2 samples. Runs longer than one period are split into full periods,
+    and a remainder of one sample more than a full period is split into two shorter periods instead.
+
+    :param samples: Number of samples in the run
+    :returns: List of period lengths
     """
+    if samples <= 0:
+        return []
+    if samples < 2:
+        return [samples-2]
+    nfull, rem = divmod(samples-2, MAX_PATTERN_PERIOD_LENGTH+2)
+    lengths = [MAX_PATTERN_PERIOD_LENGTH]*nfull
+    if rem == MAX_PATTERN_PERIOD_LENGTH+1:
+        lengths += [MAX_PATTERN_PERIOD_LENGTH-1, 0]
+    else:
+        lengths.append(rem)
+    return lengths
+
+@lru_cache(maxsize=64)
+def _calc_pulse_pattern(frequency:float, duty_cycle:float, bf_clk:float):
+    warnings = []
     clk_div_n = 0
     while clk_div_n < 6:
         clk_n = bf_clk / (2**clk_div_n)
@@ -156,12 +315,12 @@ def calc_pulse_pattern(frequency:float, duty_cycle:float=DEFAULT_PATTERN_DUTY_CY
         second_half_period_samples = period_samples - first_half_period_samples
         first_on_samples = int(first_half_period_samples * duty_cycle)
         if first_on_samples < 2:
-            logging.warning(f"Duty cycle too short. Setting to minimum of 2 samples")
+            warnings.append("Duty cycle too short. Setting to minimum of 2 samples")
             first_on_samples = 2
         first_off_samples = first_half_period_samples - first_on_samples
         second_on_samples = max(2, int(second_half_period_samples * duty_cycle))
         if second_on_samples < 2:
-            logging.warning(f"Duty cycle too short. Setting to minimum of 2 samples")
+            warnings.append("Duty cycle too short. Setting to minimum of 2 samples")
             second_on_samples = 2
         second_off_samples = second_half_period_samples - second_on_samples
         if first_off_samples > 0 and first_off_samples < 2:
@@ -175,32 +334,33 @@ def calc_pulse_pattern(frequency:float, duty_cycle:float=DEFAULT_PATTERN_DUTY_CY
         per_lengths = []
         per_levels = []
         for i, samples in enumerate([first_on_samples, first_off_samples, second_on_samples, second_off_samples]):
-            while samples > 0:
-                if samples > MAX_PATTERN_PERIOD_LENGTH+2:
-                    if samples == MAX_PATTERN_PERIOD_LENGTH+3:
-                        per_lengths.append(MAX_PATTERN_PERIOD_LENGTH-1)
-                        samples -= (MAX_PATTERN_PERIOD_LENGTH+1)
-                    else:
-                        per_lengths.append(MAX_PATTERN_PERIOD_LENGTH)
-                        samples -= (MAX_PATTERN_PERIOD_LENGTH+2)
-                    per_levels.append(levels[i])
-                else:
-                    per_lengths.append(samples-2)
-                    per_levels.append(levels[i])
-                    samples = 0
+            lengths = _split_samples(samples)
+            per_lengths.extend(lengths)
+            per_levels.extend([levels[i]]*len(lengths))
         if len(per_levels) <= MAX_PATTERN_PERIODS:
-            t = (np.arange(np.sum(np.array(per_lengths)+2))*(1/clk_n)).tolist()
-            y = np.concatenate([[yi]*(ni+2) for yi,ni in zip(per_levels, per_lengths)]).tolist()
-            pattern = {'levels': per_levels,
-                        'lengths': per_lengths,
-                        'clk_div_n': clk_div_n,
-                        't': t,
-                        'y': y}
-            return pattern
+            return tuple(per_levels), tuple(per_lengths), clk_div_n, tuple(warnings)
         else:
             clk_div_n += 1
     raise ValueError(f"Pattern requires too many periods ({len(per_levels)} > {MAX_PATTERN_PERIODS})")
 
+@lru_cache(maxsize=64)
+def _pulse_pattern_waveform(frequency:float, duty_cycle:float, bf_clk:float):
+    """
+    Samples the pattern waveform, which the register builders themselves do not need
+
+    :returns: Tuples of the sample times and levels
+    """
+    levels, lengths, clk_div_n, _ = _calc_pulse_pattern(frequency, duty_cycle, bf_clk)
+    clk_n = bf_clk / (2**clk_div_n)
+    # At most 16 periods, so plain Python beats building small intermediate arrays
+    total_samples = sum(lengths) + 2*len(lengths)
+    t = tuple((np.arange(total_samples)*(1/clk_n)).tolist())
+    y = []
+    for level, length in zip(levels, lengths):
+        y.extend([level]*(length+2))
+    return t, tuple(y)
+
+@lru_cache(maxsize=None)
 def get_pattern_location(period:int, profile:int=1):
     """
     Gets the address and least significant bit of a pattern period
@@ -211,20 +371,22 @@ def get_pattern_location(period:int, profile:int=1):
     """
     if period not in PATTERN_MAP:
         raise ValueError(f"Invalid period {period}.")
-    if profile not in VALID_PATTERN_PROFILES:
+    if profile not in _VALID_PATTERN_PROFILES_SET:
         raise ValueError(f"Invalid profile {profile}.")
-    address = ADDRESSES_PATTERN_DATA[0] + (profile-1) * PATTERN_PROFILE_OFFSET + PATTERN_MAP[period]['row']
-    lsb_lvl = PATTERN_MAP[period]['lsb_lvl']
-    lsb_period = PATTERN_MAP[period]['lsb_period']
+    address = ADDRESSES_PATTERN_DATA[0] + (profile-1) * PATTERN_PROFILE_OFFSET + int(_PAT_ROW[period-1])
+    lsb_lvl = int(_PAT_LSB_LVL[period-1])
+    lsb_period = int(_PAT_LSB_PER[period-1])
     return address, lsb_lvl, lsb_period
 
 def print_regs(d):
+    lines = []
     for addr, val in sorted(d.items()):
         if isinstance(val, list):
-            for i, v in enumerate(val):
-                print(f'0x{addr:X}[+{i:d}]:x{v:08X}')
+            lines.extend(f'0x{addr:X}[+{i:d}]:x{v:08X}' for i, v in enumerate(val))
         else:
-            print(f'0x{addr:X}:x{val:08X}')
+            lines.append(f'0x{addr:X}:x{val:08X}')
+    if lines:
+        print('\n'.join(lines))
 
 def pack_registers(regs, pack_single:bool=False):
     """
@@ -234,25 +396,26 @@ def pack_registers(regs, pack_single:bool=False):
     :param pack_single: Pack single registers into arrays. Default True.
     :returns: Dictionary of packed registers.
     """
-    addresses = sorted(regs.keys())
-    if len(addresses) == 0:
+    if len(regs) == 0:
         return {}
-    last_addr = -255
-    burst_addr = -255
+    addresses = np.fromiter(regs.keys(), dtype=np.int64, count=len(regs))
+    addresses.sort()
+    breaks = np.flatnonzero(np.diff(addresses) != 1) + 1
     packed = {}
-    for addr in addresses:
-        if addr == last_addr+1 and burst_addr in packed:
-            packed[burst_addr].append(regs[addr])
-        else:
-            packed[addr] = [regs[addr]]
-            burst_addr = addr
-        last_addr = addr
-    if not pack_single:
-        for addr, val in packed.items():
-            if len(val) == 1:
-                packed[addr] = val[0]
+    for burst in np.split(addresses, breaks):
+        values = [regs[addr] for addr in burst.tolist()]
+        packed[int(burst[0])] = values if (pack_single or len(values) > 1) else values[0]
     return packed
 
+def _copy_registers(regs):
+    """
+    Copies a dictionary of registers, including the lists of packed registers
+
+    :param regs: Dictionary of registers
+    :returns: Copy of the registers that shares no mutable values with the original
+    """
+    return {addr: list(val) if isinstance(val, list) else val for addr, val in regs.items()}
+
 def swap_byte_order(regs):
     """
     Swaps the byte order of the registers
@@ -260,31 +423,66 @@ def swap_byte_order(regs):
     :param regs: Dictionary of registers
     :returns: Dictionary of registers with swapped byte order
     """
+    # Swap every value in one pass over a flat uint32 array, then restore the list/scalar layout
+    values = []
+    for val in regs.values():
+        if isinstance(val, list):
+            values.extend(val)
+        else:
+            values.append(val)
+    flat = np.array(values, dtype=np.uint32).byteswap().tolist()
     swapped = {}
+    i = 0
     for addr, val in regs.items():
         if isinstance(val, list):
-            swapped[addr] = [int.from_bytes(v.to_bytes(REGISTER_BYTES, 'big'), 'little') for v in val]
+            swapped[addr] = flat[i:i+len(val)]
+            i += len(val)
         else:
-            swapped[addr] = int.from_bytes(val.to_bytes(REGISTER_BYTES, 'big'), 'little')
+            swapped[addr] = flat[i]
+            i += 1
     return swapped
 
-@dataclass
+@dataclass(slots=True)
 class DelayProfile:
     profile: int
     delays: List[float]
     apodizations: Optional[List[int]] = None
     units: str = 's'
+    num_elements: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
+        self.delays = np.ascontiguousarray(self.delays, dtype=np.float64)
         self.num_elements = len(self.delays)
         if self.apodizations is None:
-            self.apodizations = [1]*self.num_elements
+            self.apodizations = np.ones(self.num_elements)
+        else:
+            self.apodizations = np.ascontiguousarray(self.apodizations, dtype=np.float64)
         if len(self.apodizations) != self.num_elements:
             raise ValueError(f"Apodizations list must have {self.num_elements} elements")
-        if self.profile not in VALID_DELAY_PROFILES:
+        if self.profile not in _VALID_DELAY_PROFILES_SET:
             raise ValueError(f"Invalid Profile {self.profile}")
 
-@dataclass
+    def __eq__(self, other):
+        if not isinstance(other, DelayProfile):
+            return NotImplemented
+        return (self.profile == other.profile and
+                self.units == other.units and
+                np.array_equal(self.delays, other.delays) and
+                np.array_equal(self.apodizations, other.apodizations))
+
+    def _select_channels(self, channels: slice) -> 'DelayProfile':
+        """
+        Build the delay profile of a contiguous block of channels
+
+        The new profile holds views into this profile's arrays rather than copies, so in-place edits
+        of this profile's delays and apodizations show up in it too, and no per-channel arrays are built.
+
+        :param channels: Slice of the channels to keep
+        :returns: Delay profile over the selected channels
+        """
+        return DelayProfile(self.profile, self.delays[channels], self.apodizations[channels], self.units)
+
+@dataclass(slots=True)
 class PulseProfile:
     profile: int
     frequency: float
@@ -294,39 +492,44 @@ class PulseProfile:
     invert: bool=False
 
     def __post_init__(self):
-        if self.profile not in VALID_PATTERN_PROFILES:
+        if self.profile not in _VALID_PATTERN_PROFILES_SET:
             raise ValueError(f"Invalid profile {self.profile}.")
 
-@dataclass
+@dataclass(slots=True)
 class Tx7332Registers:
     bf_clk: float = DEFAULT_CLK_FREQ
     _delay_profiles_list: List[DelayProfile] = field(default_factory=list)
     _pulse_profiles_list: List[PulseProfile] = field(default_factory=list)
     active_delay_profile: Optional[int] = None
     active_pulse_profile: Optional[int] = None
+    _delay_pos: Dict[int,int] = field(init=False, repr=False, compare=False)
+    _pulse_pos: Dict[int,int] = field(init=False, repr=False, compare=False)
+    _data_cache: Dict = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        delay_profiles = self.configured_delay_profiles()
-        if len(delay_profiles) != len(set(delay_profiles)):
+        self._delay_pos = {p.profile: i for i, p in enumerate(self._delay_profiles_list)}
+        self._pulse_pos = {p.profile: i for i, p in enumerate(self._pulse_profiles_list)}
+        # Data register words per (kind, profile number), stored with the inputs they were built from
+        self._data_cache = {}
+        if len(self._delay_pos) != len(self._delay_profiles_list):
             raise ValueError(f"Duplicate delay profiles found")
         if self.active_delay_profile is not None:
-            if self.active_delay_profile not in delay_profiles:
+            if self.active_delay_profile not in self._delay_pos:
                 raise ValueError(f"Delay profile {self.active_delay_profile} not found")
-        pulse_profiles = self.configured_pulse_profiles()
-        if len(pulse_profiles) != len(set(pulse_profiles)):
+        if len(self._pulse_pos) != len(self._pulse_profiles_list):
             raise ValueError(f"Duplicate pulse profiles found")
         if self.active_pulse_profile is not None:
-            if self.active_pulse_profile not in pulse_profiles:
+            if self.active_pulse_profile not in self._pulse_pos:
                 raise ValueError(f"Pulse profile {self.active_pulse_profile} not found")
 
     def add_delay_profile(self, delay_profile: DelayProfile, activate: Optional[bool]=None):
         if delay_profile.num_elements != NUM_CHANNELS:
             raise ValueError(f"Delay profile must have {NUM_CHANNELS} elements")
-        profiles = self.configured_delay_profiles()
-        if delay_profile.profile in profiles:
-            i = profiles.index(delay_profile.profile)
+        i = self._delay_pos.get(delay_profile.profile)
+        if i is not None:
             self._delay_profiles_list[i] = delay_profile
         else:
+            self._delay_pos[delay_profile.profile] = len(self._delay_profiles_list)
             self._delay_profiles_list.append(delay_profile)
         if activate is None:
             activate = self.active_delay_profile is None
@@ -334,11 +537,11 @@ class Tx7332Registers:
             self.active_delay_profile = delay_profile.profile
 
     def add_pulse_profile(self, pulse_profile: PulseProfile, activate: Optional[bool]=None):
-        profiles = self.configured_pulse_profiles()
-        if pulse_profile.profile in profiles:
-            i = profiles.index(pulse_profile.profile)
+        i = self._pulse_pos.get(pulse_profile.profile)
+        if i is not None:
             self._pulse_profiles_list[i] = pulse_profile
         else:
+            self._pulse_pos[pulse_profile.profile] = len(self._pulse_profiles_list)
             self._pulse_profiles_list.append(pulse_profile)
         if activate is None:
             activate = self.active_pulse_profile is None
@@ -346,54 +549,65 @@ class Tx7332Registers:
             self.active_pulse_profile = pulse_profile.profile
 
     def remove_delay_profile(self, profile:int):
-        profiles = self.configured_delay_profiles()
-        if profile not in profiles:
+        if profile not in self._delay_pos:
             raise ValueError(f"Delay profile {profile} not found")
-        profile = profiles.index(profile)
-        del self._delay_profiles_list[profile]
+        i = self._delay_pos.pop(profile)
+        del self._delay_profiles_list[i]
+        for p in self._delay_profiles_list[i:]:
+            self._delay_pos[p.profile] -= 1
         if self.active_delay_profile == profile:
             self.active_delay_profile = None
 
     def remove_pulse_profile(self, profile:int):
-        profiles = self.configured_pulse_profiles()
-        if profile not in profiles:
+        if profile not in self._pulse_pos:
             raise ValueError(f"Pulse profile {profile} not found")
-        profile = profiles.index(profile)
-        del self._pulse_profiles_list[profile]
+        i = self._pulse_pos.pop(profile)
+        del self._pulse_profiles_list[i]
+        for p in self._pulse_profiles_list[i:]:
+            self._pulse_pos[p.profile] -= 1
         if self.active_pulse_profile == profile:
             self.active_pulse_profile = None
 
     def get_delay_profile(self, profile: Optional[int]=None) -> DelayProfile:
         if profile is None:
             profile = self.active_delay_profile
-        profiles = self.configured_delay_profiles()
-        if profile not in profiles:
+        if profile not in self._delay_pos:
             raise ValueError(f"Delay profile {profile} not found")
-        profile = profiles.index(profile)
-        return self._delay_profiles_list[profile]
+        return self._delay_profiles_list[self._delay_pos[profile]]
 
     def configured_delay_profiles(self) -> List[int]:
-        return [p.profile for p in self._delay_profiles_list]
+        return list(self._delay_pos)
 
     def get_pulse_profile(self, profile: Optional[int]=None) -> PulseProfile:
         if profile is None:
             profile = self.active_pulse_profile
-        profiles = self.configured_pulse_profiles()
-        if profile not in profiles:
+        if profile not in self._pulse_pos:
             raise ValueError(f"Pulse profile {profile} not found")
-        profile = profiles.index(profile)
-        return self._pulse_profiles_list[profile]
+        return self._pulse_profiles_list[self._pulse_pos[profile]]
 
     def configured_pulse_profiles(self) -> List[int]:
-        return [p.profile for p in self._pulse_profiles_list]
+        return list(self._pulse_pos)
+
+    def reset_delay_profiles(self, delay_profiles: List[DelayProfile], active_profile: Optional[int]=None):
+        for delay_profile in delay_profiles:
+            if delay_profile.num_elements != NUM_CHANNELS:
+                raise ValueError(f"Delay profile must have {NUM_CHANNELS} elements")
+        self._delay_profiles_list = list(delay_profiles)
+        self._delay_pos = {p.profile: i for i, p in enumerate(self._delay_profiles_list)}
+        self.active_delay_profile = active_profile if active_profile in self._delay_pos else None
+
+    def reset_pulse_profiles(self, pulse_profiles: List[PulseProfile], active_profile: Optional[int]=None):
+        self._pulse_profiles_list = list(pulse_profiles)
+        self._pulse_pos = {p.profile: i for i, p in enumerate(self._pulse_profiles_list)}
+        self.active_pulse_profile = active_profile if active_profile in self._pulse_pos else None
 
     def activate_delay_profile(self, profile:int):
-        if profile not in self.configured_delay_profiles():
+        if profile not in self._delay_pos:
             raise ValueError(f"Delay profile {profile} not configured")
         self.active_delay_profile = profile
 
     def activate_pulse_profile(self, profile:int):
-        if profile not in self.configured_pulse_profiles():
+        if profile not in self._pulse_pos:
             raise ValueError(f"Pulse profile {profile} not configured")
         self.active_pulse_profile = profile
 
@@ -401,12 +615,14 @@ class Tx7332Registers:
         if profile is None:
             profile = self.active_delay_profile
         delay_profile = self.get_delay_profile(profile)
-        apod_register = 0
-        for i, apod in enumerate(delay_profile.apodizations):
-            apod_register = set_register_value(apod_register, 1-apod, lsb=i, width=1)
-        delay_sel_register = 0
-        delay_sel_register = set_register_value(delay_sel_register, delay_profile.profile-1, lsb=12, width=4)
-        delay_sel_register = set_register_value(delay_sel_register, delay_profile.profile-1, lsb=28, width=4)
+        disable = 1 - delay_profile.apodizations
+        invalid = (disable < 0) | (disable > 1)
+        if np.any(invalid):
+            raise ValueError(f"Value {disable[invalid][0]} does not fit in 1 bits")
+        apod_bits = np.packbits(disable.astype(np.uint8), bitorder='little')
+        apod_register = int.from_bytes(apod_bits.tobytes(), 'little')
+        delay_sel = delay_profile.profile-1
+        delay_sel_register = (delay_sel << 12) | (delay_sel << 28)
         return {ADDRESS_DELAY_SEL: delay_sel_register,
                 ADDRESS_APODIZATION: apod_register}
 
@@ -414,24 +630,19 @@ class Tx7332Registers:
         if profile is None:
             profile = self.active_pulse_profile
         pulse_profile = self.get_pulse_profile(profile)
-        if pulse_profile.profile not in VALID_PATTERN_PROFILES:
+        pattern = calc_pulse_pattern(pulse_profile.frequency, pulse_profile.duty_cycle, bf_clk=self.bf_clk, with_waveform=False)
+        return self._pulse_control_registers(pulse_profile, pattern)
+
+    def _pulse_control_registers(self, pulse_profile: PulseProfile, pattern: dict) -> Dict[int,int]:
+        if pulse_profile.profile not in _VALID_PATTERN_PROFILES_SET:
             raise ValueError(f"Invalid profile {pulse_profile.profile}.")
-        pattern = calc_pulse_pattern(pulse_profile.frequency, pulse_profile.duty_cycle, bf_clk=self.bf_clk)
         clk_div_n = pattern['clk_div_n']
-        clk_div = 2**clk_div_n
-        clk_n = self.bf_clk / clk_div
         cycles = pulse_profile.cycles
         if cycles > (MAX_REPEAT+1):
             # Use elastic repeat
             pulse_duration_samples = cycles * self.bf_clk / pulse_profile.frequency
             repeat = 0
             elastic_repeat = int(pulse_duration_samples / 16)
-            period_samples = int(clk_n / pulse_profile.frequency)
-            cycles = 16*elastic_repeat / period_samples
-            y = pattern['y']*int(cycles+1)
-            y = y[:(16*elastic_repeat)]
-            y = y + ([0]*pulse_profile.tail_count)
-            t = np.arange(len(y))*(1/clk_n)
             elastic_mode = 1
             if elastic_repeat > MAX_ELASTIC_REPEAT:
                 raise ValueError(f"Pattern duration too long for elastic repeat")
@@ -439,18 +650,17 @@ class Tx7332Registers:
             repeat = cycles-1
             elastic_repeat = 0
             elastic_mode = 0
-            y = pattern['y']*(repeat+1)
-            y = np.array(y + [0]*pulse_profile.tail_count)
-        reg_mode =  0x02000003
-        reg_mode = set_register_value(reg_mode, clk_div_n, lsb=3, width=3)
-        reg_mode = set_register_value(reg_mode, int(pulse_profile.invert), lsb=6, width=1)
-        reg_repeat = 0
-        reg_repeat = set_register_value(reg_repeat, repeat, lsb=1, width=5)
-        reg_repeat = set_register_value(reg_repeat, pulse_profile.tail_count, lsb=6, width=5)
-        reg_repeat = set_register_value(reg_repeat, elastic_mode, lsb=11, width=1)
-        reg_repeat = set_register_value(reg_repeat, elastic_repeat, lsb=12, width=16)
-        reg_pat_sel = 0
-        reg_pat_sel = set_register_value(reg_pat_sel, pulse_profile.profile-1, lsb=0, width=6)
+        invert = int(pulse_profile.invert)
+        if invert < 0 or invert > 1:
+            raise ValueError(f"Value {invert} does not fit in 1 bits")
+        if repeat < 0 or repeat > MAX_REPEAT:
+            raise ValueError(f"Value {repeat} does not fit in 5 bits")
+        tail_count = pulse_profile.tail_count
+        if tail_count < 0 or tail_count > 0b11111:
+            raise ValueError(f"Value {tail_count} does not fit in 5 bits")
+        reg_mode = 0x02000003 | (clk_div_n << 3) | (invert << 6)
+        reg_repeat = (int(repeat) << 1) | (int(tail_count) << 6) | (elastic_mode << 11) | (elastic_repeat << 12)
+        reg_pat_sel = pulse_profile.profile-1
         registers = {ADDRESS_PATTERN_MODE: reg_mode,
                      ADDRESS_PATTERN_REPEAT: reg_repeat,
                      ADDRESS_PATTERN_SEL_G1: reg_pat_sel,
@@ -461,42 +671,66 @@ class Tx7332Registers:
         if profile is None:
             profile = self.active_delay_profile
         delay_profile = self.get_delay_profile(profile)
-        data_registers = {}
-        for channel in range(1, NUM_CHANNELS+1):
-            address, lsb = get_delay_location(channel, delay_profile.profile)
-            if address not in data_registers:
-                data_registers[address] = 0
-            delay_value = int(delay_profile.delays[channel-1] * getunitconversion(delay_profile.units, 's') * self.bf_clk)
-            data_registers[address] = set_register_value(data_registers[address], delay_value, lsb=lsb, width=DELAY_WIDTH)
-        if pack:
-            data_registers = pack_registers(data_registers, pack_single=pack_single)
-        return data_registers
+        return self._delay_data_registers(delay_profile, pack=pack, pack_single=pack_single)
+
+    def _delay_data_registers(self, delay_profile: DelayProfile, pack: bool=False, pack_single: bool=False) -> Dict[int,int]:
+        # The delays are compared by value, so edits made in place are picked up without explicit invalidation
+        key = ('delay', delay_profile.profile)
+        inputs = (delay_profile.delays.tobytes(), delay_profile.units, self.bf_clk)
+        cached = self._data_cache.get(key)
+        if cached is not None and cached[0] == inputs:
+            words = cached[1]
+        else:
+            words = tuple(_delay_words(delay_profile.delays, delay_profile.units, self.bf_clk).tolist())
+            self._data_cache[key] = (inputs, words)
+        return _data_registers(_delay_data_addresses(delay_profile.profile), words, pack=pack, pack_single=pack_single)
 
     def get_pulse_data_registers(self, profile: Optional[int]=None, pack: bool=False, pack_single: bool=False) -> Dict[int,int]:
         if profile is None:
             profile = self.active_pulse_profile
         pulse_profile = self.get_pulse_profile(profile)
-        data_registers = {}
-        pattern = calc_pulse_pattern(pulse_profile.frequency, pulse_profile.duty_cycle, bf_clk=self.bf_clk)
-        levels = pattern['levels']
-        lengths = pattern['lengths']
+        return self._pulse_data_registers(pulse_profile, pack=pack, pack_single=pack_single)
+
+    def _pulse_data_registers(self, pulse_profile: PulseProfile, pack: bool=False, pack_single: bool=False, pattern: Optional[dict]=None) -> Dict[int,int]:
+        key = ('pulse', pulse_profile.profile)
+        inputs = (pulse_profile.frequency, pulse_profile.duty_cycle, self.bf_clk)
+        cached = self._data_cache.get(key)
+        if cached is not None and cached[0] == inputs:
+            words = cached[1]
+        else:
+            words = self._pulse_data_words(pulse_profile, pattern)
+            self._data_cache[key] = (inputs, words)
+        return _data_registers(_pattern_data_addresses(pulse_profile.profile), words, pack=pack, pack_single=pack_single)
+
+    def _pulse_data_words(self, pulse_profile: PulseProfile, pattern: Optional[dict]=None) -> Tuple[int, ...]:
+        if pattern is None:
+            pattern = calc_pulse_pattern(pulse_profile.frequency, pulse_profile.duty_cycle, bf_clk=self.bf_clk, with_waveform=False)
+        levels = np.asarray(pattern['levels'], dtype=np.int64)
+        lengths = np.asarray(pattern['lengths'], dtype=np.int64)
         nperiods = len(levels)
-        level_lut = {-1: 0b01, 0: 0b00, 1: 0b10}
-        for i, (level, length) in enumerate(zip(levels, lengths)):
-            address, lsb_lvl, lsb_length = get_pattern_location(i+1, pulse_profile.profile)
-            if address not in data_registers:
-                data_registers[address] = 0
-            data_registers[address] = set_register_value(data_registers[address], level_lut[level], lsb=lsb_lvl, width=PATTERN_LEVEL_WIDTH)
-            data_registers[address] = set_register_value(data_registers[address], length, lsb=lsb_length, width=PATTERN_LENGTH_WIDTH)
-        if nperiods< MAX_PATTERN_PERIODS:
-            address, lsb_lvl, lsb_length = get_pattern_location(nperiods+1, pulse_profile.profile)
-            if address not in data_registers:
-                data_registers[address] = 0
-            data_registers[address] = set_register_value(data_registers[address], 0b111, lsb=lsb_lvl, width=PATTERN_LEVEL_WIDTH)
-            data_registers[address] = set_register_value(data_registers[address], 0, lsb=lsb_length, width=PATTERN_LENGTH_WIDTH)
-        if pack:
-            data_registers = pack_registers(data_registers, pack_single=pack_single)
-        return data_registers
+        invalid = (lengths < 0) | (lengths > _PATTERN_LENGTH_MAX)
+        if np.any(invalid):
+            raise ValueError(f"Value {lengths[invalid][0]} does not fit in {PATTERN_LENGTH_WIDTH} bits")
+        fields = (_LEVEL_LUT[levels+1] << _PAT_LSB_LVL[:nperiods]) | (lengths << _PAT_LSB_PER[:nperiods])
+        # Only the rows up to the last written period are emitted
+        words = np.zeros(_PAT_ROW[min(nperiods, MAX_PATTERN_PERIODS-1)]+1, dtype=np.int64)
+        np.bitwise_or.at(words, _PAT_ROW[:nperiods], fields)
+        if nperiods < MAX_PATTERN_PERIODS:
+            # Terminate a short pattern with an end-of-pattern level in the next period
+            words[_PAT_ROW[nperiods]] |= 0b111 << _PAT_LSB_LVL[nperiods]
+        return tuple(words.tolist())
+
+    def _get_pulse_regs(self, pulse_profile: PulseProfile, pack: bool=False, pack_single: bool=False) -> Tuple[Dict[int,int], Dict[int,int]]:
+        """
+        Computes the pattern of a pulse profile once and builds both its control and data registers
+
+        :param pulse_profile: Pulse profile
+        :returns: Tuple of the control registers and the data registers
+        """
+        pattern = calc_pulse_pattern(pulse_profile.frequency, pulse_profile.duty_cycle, bf_clk=self.bf_clk, with_waveform=False)
+        control_registers = self._pulse_control_registers(pulse_profile, pattern)
+        data_registers = self._pulse_data_registers(pulse_profile, pack=pack, pack_single=pack_single, pattern=pattern)
+        return control_registers, data_registers
 
     def get_registers(self, profiles: ProfileOpts = "configured", pack: bool=False, pack_single: bool=False) -> Dict[int,int]:
         if len(self._delay_profiles_list) == 0:
@@ -507,23 +741,29 @@ class Tx7332Registers:
             raise ValueError(f"No delay profile activated")
         if self.active_pulse_profile is None:
             raise ValueError(f"No pulse profile activated")
-        registers = {addr:0x0 for addr in ADDRESSES_GLOBAL}
+        registers = _GLOBAL_TEMPLATE.copy()
         registers.update(self.get_delay_control_registers())
-        registers.update(self.get_pulse_control_registers())
+        active_pulse_profile = self.get_pulse_profile()
+        pulse_control, active_pulse_data = self._get_pulse_regs(active_pulse_profile, pack=pack, pack_single=pack_single)
+        registers.update(pulse_control)
         if profiles == "active":
             delay_data = self.get_delay_data_registers(pack=pack, pack_single=pack_single)
-            pulse_data = self.get_pulse_data_registers(pack=pack, pack_single=pack_single)
+            pulse_data = active_pulse_data
         else:
             if profiles == "all":
-                delay_data = {addr:0x0 for addr in ADDRESSES_DELAY_DATA}
-                pulse_data = {addr:0x0 for addr in ADDRESSES_PATTERN_DATA}
+                delay_data = _DELAY_DATA_TEMPLATE.copy()
+                pulse_data = _PATTERN_DATA_TEMPLATE.copy()
             else:
                 delay_data = {}
                 pulse_data = {}
+            # The profile objects are already in hand, so skip the lookup by profile number
             for delay_profile in self._delay_profiles_list:
-                delay_data.update(self.get_delay_data_registers(profile=delay_profile.profile, pack=pack, pack_single=pack_single))
+                delay_data.update(self._delay_data_registers(delay_profile, pack=pack, pack_single=pack_single))
             for pulse_profile in self._pulse_profiles_list:
-                pulse_data.update(self.get_pulse_data_registers(profile=pulse_profile.profile, pack=pack, pack_single=pack_single))
+                if pulse_profile is active_pulse_profile:
+                    pulse_data.update(active_pulse_data)
+                else:
+                    pulse_data.update(self._pulse_data_registers(pulse_profile, pack=pack, pack_single=pack_single))
         if pack:
             delay_data = pack_registers(delay_data, pack_single=pack_single)
             pulse_data = pack_registers(pulse_data, pack_single=pack_single)
@@ -531,7 +771,44 @@ class Tx7332Registers:
         registers.update(pulse_data)
         return registers
 
-@dataclass
+def _delay_digest(delay_profile: DelayProfile) -> bytes:
+    """
+    Hashes the contents of a delay profile
+
+    :param delay_profile: Delay profile
+    :returns: Digest of the delays, apodizations and units
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(delay_profile.delays.tobytes())
+    h.update(delay_profile.apodizations.tobytes())
+    h.update(delay_profile.units.encode())
+    return h.digest()
+
+def _profile_state(delay_profiles: List[DelayProfile], pulse_profiles: List[PulseProfile]) -> tuple:
+    """
+    Summarizes the contents of a set of profiles
+
+    Profiles can be edited in place, so register caches key on this rather than on the profile objects.
+
+    :param delay_profiles: Delay profiles
+    :param pulse_profiles: Pulse profiles
+    :returns: Tuple of the delay profile digests and the pulse profile fields
+    """
+    delay_state = tuple((dp.profile, _delay_digest(dp)) for dp in delay_profiles)
+    pulse_state = tuple((pp.profile, pp.frequency, pp.cycles, pp.duty_cycle, pp.tail_count, pp.invert) for pp in pulse_profiles)
+    return delay_state, pulse_state
+
+def _drop_stale_registers(reg_cache: Dict, state: tuple):
+    """
+    Removes the cached registers that were built from other profile contents
+
+    :param reg_cache: Register cache, keyed on tuples that end with the profile state
+    :param state: Current profile state, from _profile_state
+    """
+    for key in [key for key in reg_cache if key[-1] != state]:
+        del reg_cache[key]
+
+@dataclass(slots=True)
 class TxModule:
     i2c_addr: int = 0x0
     bf_clk: int = DEFAULT_CLK_FREQ
@@ -540,9 +817,27 @@ class TxModule:
     active_delay_profile: Optional[int] = None
     active_pulse_profile: Optional[int] = None
     num_transmitters: int = NUM_TRANSMITTERS
+    transmitters: Tuple[Tx7332Registers, ...] = field(init=False, repr=False, compare=False)
+    _tx_slices: Tuple[slice, ...] = field(init=False, repr=False, compare=False)
+    _delay_pos: Dict[int,int] = field(init=False, repr=False, compare=False)
+    _pulse_pos: Dict[int,int] = field(init=False, repr=False, compare=False)
+    _version: int = field(init=False, repr=False, compare=False)
+    _reg_cache: Dict = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         self.transmitters = tuple([Tx7332Registers(bf_clk=self.bf_clk) for _ in range(self.num_transmitters)])
+        self._tx_slices = tuple(slice(i*NUM_CHANNELS, (i+1)*NUM_CHANNELS) for i in range(self.num_transmitters))
+        self._delay_pos = {p.profile: i for i, p in enumerate(self._delay_profiles_list)}
+        self._pulse_pos = {p.profile: i for i, p in enumerate(self._pulse_profiles_list)}
+        self._version = 0
+        self._reg_cache = {}
+
+    def _bump_version(self):
+        """
+        Invalidate the cached registers after a change to the profiles
+        """
+        self._version += 1
+        self._reg_cache.clear()
 
     def add_pulse_profile(self, pulse_profile: PulseProfile, activate: Optional[bool]=None):
         """
@@ -551,11 +846,12 @@ class TxModule:
         :param p: Pulse profile
         :param activate: Activate the pulse profile
         """
-        profiles = self.configured_pulse_profiles()
-        if pulse_profile.profile in profiles:
-            i = profiles.index(pulse_profile.profile)
+        self._bump_version()
+        i = self._pulse_pos.get(pulse_profile.profile)
+        if i is not None:
             self._pulse_profiles_list[i] = pulse_profile
         else:
+            self._pulse_pos[pulse_profile.profile] = len(self._pulse_profiles_list)
             self._pulse_profiles_list.append(pulse_profile)
         if activate is None:
             activate = self.active_pulse_profile is None
@@ -571,25 +867,78 @@ class TxModule:
         :param p: Delay profile
         :param activate: Activate the delay profile
         """
+        self._bump_version()
         if delay_profile.num_elements != NUM_CHANNELS*self.num_transmitters:
             raise ValueError(f"Delay profile must have {NUM_CHANNELS*self.num_transmitters} elements")
-        profiles = self._configured_delay_profiles()
-        if delay_profile.profile in profiles:
-            i = profiles.index(delay_profile.profile)
+        i = self._delay_pos.get(delay_profile.profile)
+        if i is not None:
             self._delay_profiles_list[i] = delay_profile
         else:
+            self._delay_pos[delay_profile.profile] = len(self._delay_profiles_list)
             self._delay_profiles_list.append(delay_profile)
         if activate is None:
             activate = self.active_delay_profile is None
         if activate:
             self.active_delay_profile = delay_profile.profile
-        for i, tx in enumerate(self.transmitters):
-            start_channel = i*NUM_CHANNELS
-            profiles = np.arange(start_channel, start_channel+NUM_CHANNELS, dtype=int)
-            tx_delays = np.array(delay_profile.delays)[profiles].tolist()
-            tx_apodizations = np.array(delay_profile.apodizations)[profiles].tolist()
-            txp = DelayProfile(delay_profile.profile, tx_delays, tx_apodizations, delay_profile.units)
-            tx.add_delay_profile(txp, activate = activate)
+        for tx, channels in zip(self.transmitters, self._tx_slices):
+            tx.add_delay_profile(delay_profile._select_channels(channels), activate = activate)
+
+    def add_pulse_profiles(self, pulse_profiles: List[PulseProfile], activate: Optional[int]=None):
+        """
+        Add several pulse profiles at once
+
+        :param pulse_profiles: Pulse profiles
+        :param activate: Pulse profile number to activate. By default, the first profile is activated if none is active.
+        """
+        self._bump_version()
+        if activate is None and self.active_pulse_profile is None and len(pulse_profiles) > 0:
+            activate = pulse_profiles[0].profile
+        if activate is not None and activate not in self._pulse_pos and all(p.profile != activate for p in pulse_profiles):
+            raise ValueError(f"Pulse profile {activate} not found")
+        for pulse_profile in pulse_profiles:
+            i = self._pulse_pos.get(pulse_profile.profile)
+            if i is not None:
+                self._pulse_profiles_list[i] = pulse_profile
+            else:
+                self._pulse_pos[pulse_profile.profile] = len(self._pulse_profiles_list)
+                self._pulse_profiles_list.append(pulse_profile)
+        if activate is not None:
+            self.active_pulse_profile = activate
+        for tx in self.transmitters:
+            for pulse_profile in pulse_profiles:
+                tx.add_pulse_profile(pulse_profile, activate=False)
+            if activate is not None:
+                tx.activate_pulse_profile(activate)
+
+    def add_delay_profiles(self, delay_profiles: List[DelayProfile], activate: Optional[int]=None):
+        """
+        Add several delay profiles at once
+
+        :param delay_profiles: Delay profiles
+        :param activate: Delay profile number to activate. By default, the first profile is activated if none is active.
+        """
+        self._bump_version()
+        for delay_profile in delay_profiles:
+            if delay_profile.num_elements != NUM_CHANNELS*self.num_transmitters:
+                raise ValueError(f"Delay profile must have {NUM_CHANNELS*self.num_transmitters} elements")
+        if activate is None and self.active_delay_profile is None and len(delay_profiles) > 0:
+            activate = delay_profiles[0].profile
+        if activate is not None and activate not in self._delay_pos and all(p.profile != activate for p in delay_profiles):
+            raise ValueError(f"Delay profile {activate} not found")
+        for delay_profile in delay_profiles:
+            i = self._delay_pos.get(delay_profile.profile)
+            if i is not None:
+                self._delay_profiles_list[i] = delay_profile
+            else:
+                self._delay_pos[delay_profile.profile] = len(self._delay_profiles_list)
+                self._delay_profiles_list.append(delay_profile)
+        if activate is not None:
+            self.active_delay_profile = activate
+        for tx, channels in zip(self.transmitters, self._tx_slices):
+            for delay_profile in delay_profiles:
+                tx.add_delay_profile(delay_profile._select_channels(channels), activate=False)
+            if activate is not None:
+                tx.activate_delay_profile(activate)
 
     def remove_delay_profile(self, profile:int):
         """
@@ -597,11 +946,13 @@ class TxModule:
 
         :param profile: Delay profile number
         """
-        profiles = self._configured_delay_profiles()
-        if profile not in profiles:
+        self._bump_version()
+        if profile not in self._delay_pos:
             raise ValueError(f"Delay profile {profile} not found")
-        i = profiles.index(profile)
+        i = self._delay_pos.pop(profile)
         del self._delay_profiles_list[i]
+        for p in self._delay_profiles_list[i:]:
+            self._delay_pos[p.profile] -= 1
         if self.active_delay_profile == profile:
             self.active_delay_profile = None
         for tx in self.transmitters:
@@ -613,11 +964,13 @@ class TxModule:
 
         :param profile: Pulse profile number
         """
-        profiles = self.configured_pulse_profiles()
-        if profile not in profiles:
+        self._bump_version()
+        if profile not in self._pulse_pos:
             raise ValueError(f"Pulse profile {profile} not found")
-        i = profiles.index(profile)
+        i = self._pulse_pos.pop(profile)
         del self._pulse_profiles_list[i]
+        for p in self._pulse_profiles_list[i:]:
+            self._pulse_pos[p.profile] -= 1
         if self.active_pulse_profile == profile:
             self.active_pulse_profile = None
         for tx in self.transmitters:
@@ -632,11 +985,9 @@ class TxModule:
         """
         if profile is None:
             profile = self.active_delay_profile
-        profiles = self._configured_delay_profiles()
-        if profile not in profiles:
+        if profile not in self._delay_pos:
             raise ValueError(f"Delay profile {profile} not found")
-        i = profiles.index(profile)
-        return self._delay_profiles_list[i]
+        return self._delay_profiles_list[self._delay_pos[profile]]
 
     def _configured_delay_profiles(self) -> List[int]:
         """
@@ -644,7 +995,7 @@ class TxModule:
 
         :return: List of delay profiles
         """
-        return [p.profile for p in self._delay_profiles_list]
+        return list(self._delay_pos)
 
     def get_pulse_profile(self, profile:Optional[int]=None) -> PulseProfile:
         """
@@ -655,11 +1006,9 @@ class TxModule:
         """
         if profile is None:
             profile = self.active_pulse_profile
-        profiles = self.configured_pulse_profiles()
-        if profile not in profiles:
+        if profile not in self._pulse_pos:
             raise ValueError(f"Pulse profile {profile} not found")
-        i = profiles.index(profile)
-        return self._pulse_profiles_list[i]
+        return self._pulse_profiles_list[self._pulse_pos[profile]]
 
     def configured_pulse_profiles(self) -> List[int]:
         """
@@ -667,7 +1016,7 @@ class TxModule:
 
         :return: List of pulse profiles
         """
-        return [p.profile for p in self._pulse_profiles_list]
+        return list(self._pulse_pos)
 
     def activate_delay_profile(self, profile:int=1):
         """
@@ -675,6 +1024,10 @@ class TxModule:
 
         :param profile: Delay profile number
         """
+        if profile == self.active_delay_profile and all(tx.active_delay_profile == profile for tx in self.transmitters):
+            # Already active everywhere, so keep the cached registers
+            return
+        self._bump_version()
         for tx in self.transmitters:
             tx.activate_delay_profile(profile)
         self.active_delay_profile = profile
@@ -685,31 +1038,57 @@ class TxModule:
 
         :param profile: Pulse profile number
         """
+        if profile == self.active_pulse_profile and all(tx.active_pulse_profile == profile for tx in self.transmitters):
+            # Already active everywhere, so keep the cached registers
+            return
+        self._bump_version()
         for tx in self.transmitters:
             tx.activate_pulse_profile(profile)
         self.active_pulse_profile = profile
 
+    def reset_delay_profiles(self, delay_profiles: List[DelayProfile], active_profile: Optional[int]=None):
+        """
+        Replace all delay profiles at once
+
+        :param delay_profiles: Delay profiles covering all channels of the module
+        :param active_profile: Delay profile number to activate, if configured
+        """
+        self._bump_version()
+        for delay_profile in delay_profiles:
+            if delay_profile.num_elements != NUM_CHANNELS*self.num_transmitters:
+                raise ValueError(f"Delay profile must have {NUM_CHANNELS*self.num_transmitters} elements")
+        self._delay_profiles_list = list(delay_profiles)
+        self._delay_pos = {p.profile: i for i, p in enumerate(self._delay_profiles_list)}
+        self.active_delay_profile = active_profile if active_profile in self._delay_pos else None
+        for tx, channels in zip(self.transmitters, self._tx_slices):
+            tx_profiles = [dp._select_channels(channels) for dp in self._delay_profiles_list]
+            tx.reset_delay_profiles(tx_profiles, self.active_delay_profile)
+
+    def reset_pulse_profiles(self, pulse_profiles: List[PulseProfile], active_profile: Optional[int]=None):
+        """
+        Replace all pulse profiles at once
+
+        :param pulse_profiles: Pulse profiles
+        :param active_profile: Pulse profile number to activate, if configured
+        """
+        self._bump_version()
+        self._pulse_profiles_list = list(pulse_profiles)
+        self._pulse_pos = {p.profile: i for i, p in enumerate(self._pulse_profiles_list)}
+        self.active_pulse_profile = active_profile if active_profile in self._pulse_pos else None
+        for tx in self.transmitters:
+            tx.reset_pulse_profiles(self._pulse_profiles_list, self.active_pulse_profile)
+
     def recompute_delay_profiles(self):
         """
         Recompute the delay profiles
         """
-        for tx in self.transmitters:
-            profiles = tx.configured_delay_profiles()
-            for profile in profiles:
-                tx.remove_delay_profile(profile)
-        for dp in self._delay_profiles_list:
-            self.add_delay_profile(dp, activate = dp.profile == self.active_delay_profile)
+        self.reset_delay_profiles(self._delay_profiles_list, self.active_delay_profile)
 
     def recompute_pulse_profiles(self):
         """
         Recompute the pulse profiles
         """
-        for tx in self.transmitters:
-            profiles = tx.configured_pulse_profiles()
-            for profile in profiles:
-                tx.remove_pulse_profile(profile)
-            for pp in self._pulse_profiles_list:
-                tx.add_pulse_profile(pp, activate = pp.profile == self.active_pulse_profile)
+        self.reset_pulse_profiles(self._pulse_profiles_list, self.active_pulse_profile)
 
     def get_registers(self, profiles: ProfileOpts = "configured", recompute: bool = False, pack: bool=False, pack_single:bool=False) -> List[Dict[int,int]]:
         """
@@ -717,12 +1096,17 @@ class TxModule:
 
         :param profiles: Profile options
         :param recompute: Recompute the registers
-        :return: List of registers for each transmitter
+        :return: List of registers for each transmitter. The registers are cached until the profiles or their contents change, and each call returns a fresh copy.
         """
         if recompute:
             self.recompute_delay_profiles()
             self.recompute_pulse_profiles()
-        return [tx.get_registers(profiles, pack=pack, pack_single=pack_single) for tx in self.transmitters]
+        state = _profile_state(self._delay_profiles_list, self._pulse_profiles_list)
+        key = (profiles, pack, pack_single, self.active_delay_profile, self.active_pulse_profile, self._version, state)
+        if key not in self._reg_cache:
+            _drop_stale_registers(self._reg_cache, state)
+            self._reg_cache[key] = [tx.get_registers(profiles, pack=pack, pack_single=pack_single) for tx in self.transmitters]
+        return [_copy_registers(regs) for regs in self._reg_cache[key]]
 
     def get_delay_control_registers(self, profile:Optional[int]=None) -> List[Dict[int,int]]:
         """
@@ -757,6 +1141,20 @@ class TxModule:
             profile = self.active_delay_profile
         return [tx.get_delay_data_registers(profile, pack=pack, pack_single=pack_single) for tx in self.transmitters]
 
+    def get_delay_data_packed_array(self, profile:Optional[int]=None) -> np.ndarray:
+        """
+        Get the delay data register words for all transmitters as a single array
+
+        Row i holds the words of transmitter i, in address order starting at the
+        first delay data register of the profile.
+
+        :param profile: Delay profile number
+        :return: Array of uint32 register words with shape (num_transmitters, 16)
+        """
+        delay_profile = self.get_delay_profile(profile)
+        delays = delay_profile.delays.reshape(self.num_transmitters, NUM_CHANNELS)
+        return _delay_words(delays, delay_profile.units, self.bf_clk).astype(np.uint32)
+
     def get_pulse_data_registers(self, profile:Optional[int]=None, pack: bool=False, pack_single: bool=False) -> List[Dict[int,int]]:
         """
         Get the pulse data registers for all transmitters
@@ -768,7 +1166,7 @@ class TxModule:
             profile = self.active_pulse_profile
         return [tx.get_pulse_data_registers(profile, pack=pack, pack_single=pack_single) for tx in self.transmitters]
 
-@dataclass
+@dataclass(slots=True)
 class TxArray:
     i2c_addresses: Tuple[int] = (0x0,)
     bf_clk: int = DEFAULT_CLK_FREQ
@@ -778,12 +1176,45 @@ class TxArray:
     active_delay_profile: Optional[int] = None
     active_pulse_profile: Optional[int] = None
     num_transmitters: int = NUM_TRANSMITTERS
+    num_modules: int = field(init=False, repr=False, compare=False)
+    _delay_pos: Dict[int,int] = field(init=False, repr=False, compare=False)
+    _pulse_pos: Dict[int,int] = field(init=False, repr=False, compare=False)
+    _delay_digests: Dict[int,bytes] = field(init=False, repr=False, compare=False)
+    _module_slices: Tuple[slice, ...] = field(init=False, repr=False, compare=False)
+    _modules_items: Tuple[Tuple[int, TxModule], ...] = field(init=False, repr=False, compare=False)
+    _module_list: Tuple[TxModule, ...] = field(init=False, repr=False, compare=False)
+    _last_recompute_fp: Optional[tuple] = field(init=False, repr=False, compare=False)
+    _version: int = field(init=False, repr=False, compare=False)
+    _reg_cache: Dict = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        if len(set(self.i2c_addresses)) != len(self.i2c_addresses):
-            raise ValueError(f"Duplicate I2C addresses found")
-        self.modules = {addr:TxModule(i2c_addr=addr, bf_clk=self.bf_clk, num_transmitters=self.num_transmitters) for addr in self.i2c_addresses}
+        self.i2c_addresses = tuple(self.i2c_addresses)
+        modules = {}
+        for addr in self.i2c_addresses:
+            if addr in modules:
+                raise ValueError(f"Duplicate I2C addresses found: {addr:#x}")
+            modules[addr] = TxModule(i2c_addr=addr, bf_clk=self.bf_clk, num_transmitters=self.num_transmitters)
+        self.modules = modules
         self.num_modules = len(self.modules)
+        # The modules are fixed from here on, so iterate over tuples rather than the dict
+        self._modules_items = tuple(self.modules.items())
+        self._module_list = tuple(self.modules.values())
+        # Every module drives the same number of channels, so each one owns a fixed contiguous block
+        module_channels = NUM_CHANNELS*self.num_transmitters
+        self._module_slices = tuple(slice(i*module_channels, (i+1)*module_channels) for i in range(self.num_modules))
+        self._delay_pos = {p.profile: i for i, p in enumerate(self._delay_profiles_list)}
+        self._pulse_pos = {p.profile: i for i, p in enumerate(self._pulse_profiles_list)}
+        self._delay_digests = {}
+        self._version = 0
+        self._reg_cache = {}
+        self._last_recompute_fp = None
+
+    def _bump_version(self):
+        """
+        Invalidate the cached registers after a change to the profiles
+        """
+        self._version += 1
+        self._reg_cache.clear()
 
     def add_pulse_profile(self, pulse_profile: PulseProfile, activate: Optional[bool]=None):
         """
@@ -792,17 +1223,18 @@ class TxArray:
         :param p: Pulse profile
         :param activate: Activate the pulse profile
         """
-        profiles = self.configured_pulse_profiles()
-        if pulse_profile.profile in profiles:
-            i = profiles.index(pulse_profile.profile)
+        self._bump_version()
+        i = self._pulse_pos.get(pulse_profile.profile)
+        if i is not None:
             self._pulse_profiles_list[i] = pulse_profile
         else:
+            self._pulse_pos[pulse_profile.profile] = len(self._pulse_profiles_list)
             self._pulse_profiles_list.append(pulse_profile)
         if activate is None:
             activate = self.active_pulse_profile is None
         if activate:
             self.active_pulse_profile = pulse_profile.profile
-        for module in self.modules.values():
+        for module in self._module_list:
             module.add_pulse_profile(pulse_profile, activate)
 
     def add_delay_profile(self, delay_profile: DelayProfile, activate: Optional[bool]=None):
@@ -812,25 +1244,84 @@ class TxArray:
         :param p: Delay profile
         :param activate: Activate the delay profile
         """
+        self._bump_version()
         if delay_profile.num_elements != NUM_CHANNELS*self.num_transmitters*self.num_modules:
             raise ValueError(f"Delay profile must have {NUM_CHANNELS*self.num_transmitters*self.num_modules} elements")
-        profiles = self.configured_delay_profiles()
-        if delay_profile.profile in profiles:
-            i = profiles.index(delay_profile.profile)
+        i = self._delay_pos.get(delay_profile.profile)
+        installed = None
+        if i is not None:
+            installed = self._delay_profiles_list[i]
             self._delay_profiles_list[i] = delay_profile
         else:
+            self._delay_pos[delay_profile.profile] = len(self._delay_profiles_list)
             self._delay_profiles_list.append(delay_profile)
         if activate is None:
             activate = self.active_delay_profile is None
         if activate:
             self.active_delay_profile = delay_profile.profile
-        for i, module in enumerate(self.modules.values()):
-            start_channel = i*NUM_CHANNELS*module.num_transmitters
-            profiles = np.arange(start_channel, start_channel+NUM_CHANNELS*module.num_transmitters, dtype=int)
-            module_delays = np.array(delay_profile.delays)[profiles].tolist()
-            module_apodizations = np.array(delay_profile.apodizations)[profiles].tolist()
-            modulep = DelayProfile(delay_profile.profile, module_delays, module_apodizations, delay_profile.units)
-            module.add_delay_profile(modulep, activate = activate)
+        digest = _delay_digest(delay_profile)
+        if installed is delay_profile and self._delay_digests.get(delay_profile.profile) == digest and all(delay_profile.profile in module._delay_pos for module in self._module_list):
+            # The modules already hold views of this profile's delays, so only the activation can change
+            if activate:
+                for module in self._module_list:
+                    module.activate_delay_profile(delay_profile.profile)
+            return
+        self._delay_digests[delay_profile.profile] = digest
+        for module, channels in zip(self._module_list, self._module_slices):
+            module.add_delay_profile(delay_profile._select_channels(channels), activate = activate)
+
+    def add_pulse_profiles(self, pulse_profiles: List[PulseProfile], activate: Optional[int]=None):
+        """
+        Add several pulse profiles at once
+
+        :param pulse_profiles: Pulse profiles
+        :param activate: Pulse profile number to activate. By default, the first profile is activated if none is active.
+        """
+        self._bump_version()
+        if activate is None and self.active_pulse_profile is None and len(pulse_profiles) > 0:
+            activate = pulse_profiles[0].profile
+        if activate is not None and activate not in self._pulse_pos and all(p.profile != activate for p in pulse_profiles):
+            raise ValueError(f"Pulse profile {activate} not found")
+        for pulse_profile in pulse_profiles:
+            i = self._pulse_pos.get(pulse_profile.profile)
+            if i is not None:
+                self._pulse_profiles_list[i] = pulse_profile
+            else:
+                self._pulse_pos[pulse_profile.profile] = len(self._pulse_profiles_list)
+                self._pulse_profiles_list.append(pulse_profile)
+        if activate is not None:
+            self.active_pulse_profile = activate
+        for module in self._module_list:
+            module.add_pulse_profiles(pulse_profiles, activate)
+
+    def add_delay_profiles(self, delay_profiles: List[DelayProfile], activate: Optional[int]=None):
+        """
+        Add several delay profiles at once
+
+        :param delay_profiles: Delay profiles
+        :param activate: Delay profile number to activate. By default, the first profile is activated if none is active.
+        """
+        self._bump_version()
+        for delay_profile in delay_profiles:
+            if delay_profile.num_elements != NUM_CHANNELS*self.num_transmitters*self.num_modules:
+                raise ValueError(f"Delay profile must have {NUM_CHANNELS*self.num_transmitters*self.num_modules} elements")
+        if activate is None and self.active_delay_profile is None and len(delay_profiles) > 0:
+            activate = delay_profiles[0].profile
+        if activate is not None and activate not in self._delay_pos and all(p.profile != activate for p in delay_profiles):
+            raise ValueError(f"Delay profile {activate} not found")
+        for delay_profile in delay_profiles:
+            i = self._delay_pos.get(delay_profile.profile)
+            if i is not None:
+                self._delay_profiles_list[i] = delay_profile
+            else:
+                self._delay_pos[delay_profile.profile] = len(self._delay_profiles_list)
+                self._delay_profiles_list.append(delay_profile)
+            self._delay_digests[delay_profile.profile] = _delay_digest(delay_profile)
+        if activate is not None:
+            self.active_delay_profile = activate
+        for module, channels in zip(self._module_list, self._module_slices):
+            module_profiles = [dp._select_channels(channels) for dp in delay_profiles]
+            module.add_delay_profiles(module_profiles, activate)
 
     def remove_pulse_profile(self, profile:int):
         """
@@ -838,14 +1329,16 @@ class TxArray:
 
         :param profile: Pulse profile number
         """
-        profiles = self.configured_pulse_profiles()
-        if profile not in profiles:
+        self._bump_version()
+        if profile not in self._pulse_pos:
             raise ValueError(f"Pulse profile {profile} not found")
-        i = profiles.index(profile)
+        i = self._pulse_pos.pop(profile)
         del self._pulse_profiles_list[i]
+        for p in self._pulse_profiles_list[i:]:
+            self._pulse_pos[p.profile] -= 1
         if self.active_pulse_profile == profile:
             self.active_pulse_profile = None
-        for module in self.modules.values():
+        for module in self._module_list:
             module.remove_pulse_profile(profile)
 
     def remove_delay_profile(self, profile:int):
@@ -854,14 +1347,17 @@ class TxArray:
 
         :param profile: Delay profile number
         """
-        profiles = self.configured_delay_profiles()
-        if profile not in profiles:
+        self._bump_version()
+        if profile not in self._delay_pos:
             raise ValueError(f"Delay profile {profile} not found")
-        i = profiles.index(profile)
+        i = self._delay_pos.pop(profile)
+        self._delay_digests.pop(profile, None)
         del self._delay_profiles_list[i]
+        for p in self._delay_profiles_list[i:]:
+            self._delay_pos[p.profile] -= 1
         if self.active_delay_profile == profile:
             self.active_delay_profile = None
-        for module in self.modules.values():
+        for module in self._module_list:
             module.remove_delay_profile(profile)
 
     def get_pulse_profile(self, profile:Optional[int]=None) -> PulseProfile:
@@ -873,11 +1369,9 @@ class TxArray:
         """
         if profile is None:
             profile = self.active_pulse_profile
-        profiles = self.configured_pulse_profiles()
-        if profile not in profiles:
+        if profile not in self._pulse_pos:
             raise ValueError(f"Pulse profile {profile} not found")
-        i = profiles.index(profile)
-        return self._pulse_profiles_list[i]
+        return self._pulse_profiles_list[self._pulse_pos[profile]]
 
     def configured_pulse_profiles(self) -> List[int]:
         """
@@ -885,7 +1379,7 @@ class TxArray:
 
         :return: List of pulse profiles
         """
-        return [p.profile for p in self._pulse_profiles_list]
+        return list(self._pulse_pos)
 
     def get_delay_profile(self, profile:Optional[int]=None) -> DelayProfile:
         """
@@ -896,11 +1390,9 @@ class TxArray:
         """
         if profile is None:
             profile = self.active_delay_profile
-        profiles = self.configured_delay_profiles()
-        if profile not in profiles:
+        if profile not in self._delay_pos:
             raise ValueError(f"Delay profile {profile} not found")
-        i = profiles.index(profile)
-        return self._delay_profiles_list[i]
+        return self._delay_profiles_list[self._delay_pos[profile]]
 
     def configured_delay_profiles(self) -> List[int]:
         """
@@ -908,7 +1400,7 @@ class TxArray:
 
         :return: List of delay profiles
         """
-        return [p.profile for p in self._delay_profiles_list]
+        return list(self._delay_pos)
 
     def activate_pulse_profile(self, profile:int=1):
         """
@@ -916,7 +1408,10 @@ class TxArray:
 
         :param profile: Pulse profile number
         """
-        for module in self.modules.values():
+        if profile != self.active_pulse_profile:
+            # The cache key also tracks the module versions, so a module that has to resync invalidates it by itself
+            self._bump_version()
+        for module in self._module_list:
             module.activate_pulse_profile(profile)
         self.active_pulse_profile = profile
 
@@ -926,7 +1421,10 @@ class TxArray:
 
         :param profile: Delay profile number
         """
-        for module in self.modules.values():
+        if profile != self.active_delay_profile:
+            # The cache key also tracks the module versions, so a module that has to resync invalidates it by itself
+            self._bump_version()
+        for module in self._module_list:
             module.activate_delay_profile(profile)
         self.active_delay_profile = profile
 
@@ -934,23 +1432,27 @@ class TxArray:
         """
         Recompute the pulse profiles
         """
-        for module in self.modules.values():
-            profiles = module.configured_pulse_profiles()
-            for profile in profiles:
-                module.remove_pulse_profile(profile)
-            for pulse_profile in self._pulse_profiles_list:
-                module.add_pulse_profile(pulse_profile, activate = pulse_profile.profile == self.active_pulse_profile)
+        self._bump_version()
+        for module in self._module_list:
+            module.reset_pulse_profiles(self._pulse_profiles_list, self.active_pulse_profile)
 
     def recompute_delay_profiles(self):
         """
         Recompute the delay profiles
         """
-        for module in self.modules.values():
-            profiles = module.configured_delay_profiles()
-            for profile in profiles:
-                module.remove_delay_profile(profile)
-        for delay_profile in self._delay_profiles_list:
-            self.add_delay_profile(delay_profile, activate = delay_profile.profile == self.active_delay_profile)
+        self._bump_version()
+        for module, channels in zip(self._module_list, self._module_slices):
+            module_profiles = [dp._select_channels(channels) for dp in self._delay_profiles_list]
+            module.reset_delay_profiles(module_profiles, self.active_delay_profile)
+
+    def _recompute_fingerprint(self) -> tuple:
+        """
+        Summarize the profile state that a recompute pushes to the modules
+
+        :return: Tuple of the profile contents, the active profiles and the module versions
+        """
+        return (_profile_state(self._delay_profiles_list, self._pulse_profiles_list), self.active_delay_profile, self.active_pulse_profile,
+                tuple(module._version for module in self._module_list))
 
     def get_registers(self, profiles: ProfileOpts = "configured", recompute: bool = False, pack: bool=False, pack_single: bool=False) -> Dict[int, List[Dict[int,int]]]:
         """
@@ -958,12 +1460,19 @@ class TxArray:
 
         :param profiles: Profile options
         :param recompute: Recompute the registers
-        :return: Dictionary of registers for each module
+        :return: Dictionary of registers for each module. The registers are cached until the profiles or their contents change, and each call returns a fresh copy.
         """
-        if recompute:
+        if recompute and self._recompute_fingerprint() != self._last_recompute_fp:
             self.recompute_delay_profiles()
             self.recompute_pulse_profiles()
-        return {addr:module.get_registers(profiles, pack=pack, pack_single=pack_single) for addr, module in self.modules.items()}
+            self._last_recompute_fp = self._recompute_fingerprint()
+        state = _profile_state(self._delay_profiles_list, self._pulse_profiles_list)
+        key = (profiles, pack, pack_single, self.active_delay_profile, self.active_pulse_profile, self._version,
+               tuple(module._version for module in self._module_list), state)
+        if key not in self._reg_cache:
+            _drop_stale_registers(self._reg_cache, state)
+            self._reg_cache[key] = {addr:module.get_registers(profiles, pack=pack, pack_single=pack_single) for addr, module in self._modules_items}
+        return {addr: [_copy_registers(regs) for regs in module_regs] for addr, module_regs in self._reg_cache[key].items()}
 
     def get_delay_control_registers(self, profile:Optional[int]=None) -> Dict[int, List[Dict[int,int]]]:
         """
@@ -974,7 +1483,7 @@ class TxArray:
         """
         if profile is None:
             profile = self.active_delay_profile
-        return {addr:module.get_delay_control_registers(profile) for addr, module in self.modules.items()}
+        return {addr:module.get_delay_control_registers(profile) for addr, module in self._modules_items}
 
     def get_pulse_control_registers(self, profile:Optional[int]=None) -> Dict[int, List[Dict[int,int]]]:
         """
@@ -985,7 +1494,7 @@ class TxArray:
         """
         if profile is None:
             profile = self.active_pulse_profile
-        return {addr:module.get_pulse_control_registers(profile) for addr, module in self.modules.items()}
+        return {addr:module.get_pulse_control_registers(profile) for addr, module in self._modules_items}
 
     def get_delay_data_registers(self, profile:Optional[int]=None, pack: bool=False, pack_single: bool=False) -> Dict[int, List[Dict[int,int]]]:
         """
@@ -996,7 +1505,18 @@ class TxArray:
         """
         if profile is None:
             profile = self.active_delay_profile
-        return {addr:module.get_delay_data_registers(profile, pack=pack, pack_single=pack_single) for addr, module in self.modules.items()}
+        return {addr:module.get_delay_data_registers(profile, pack=pack, pack_single=pack_single) for addr, module in self._modules_items}
+
+    def get_delay_data_packed_arrays(self, profile:Optional[int]=None) -> Dict[int, np.ndarray]:
+        """
+        Get the delay data register words for all modules as arrays
+
+        :param profile: Delay profile number
+        :return: Dictionary of (num_transmitters, 16) uint32 register word arrays for each module
+        """
+        if profile is None:
+            profile = self.active_delay_profile
+        return {addr:module.get_delay_data_packed_array(profile) for addr, module in self._modules_items}
 
     def get_pulse_data_registers(self, profile:Optional[int]=None, pack: bool=False, pack_single: bool=False) -> Dict[int, List[Dict[int,int]]]:
         """
@@ -1007,4 +1527,4 @@ class TxArray:
         """
         if profile is None:
             profile = self.active_pulse_profile
-        return {addr:module.get_pulse_data_registers(profile, pack=pack, pack_single=pack_single) for addr, module in self.modules.items()}
+        return {addr:module.get_pulse_data_registers(profile, pack=pack, pack_single=pack_single) for addr, module in self._modules_items}
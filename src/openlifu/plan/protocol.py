@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field, InitVar
-from typing import List
+from typing import List, Sequence
 from openlifu import bf, sim, seg, xdc, geo
 import json
 import xarray as xa
@@ -61,3 +61,8 @@ class Protocol:
         delays = self.delay_method.calc_delays(arr, target, params)
         apod = self.apod_method.calc_apodization(arr, target, params)
         return delays, apod
+
+    def beamform_batch(self, arr: xdc.Transducer, targets: Sequence[geo.Point], params: xa.Dataset):
+        delays = self.delay_method.calc_delays_batch(arr, targets, params)
+        apod = self.apod_method.calc_apodization_batch(arr, targets, params)
+        return delays, apod
@@ -2,6 +2,22 @@ from dataclasses import dataclass, field
 from typing import Tuple
 import numpy as np
 
+_PARAM_INFO = {"sound_speed":{"id":"sound_speed",
+                              "name": "Speed of Sound",
+                              "units": "m/s"},
+               "density":{"id":"density",
+                          "name": "Density",
+                          "units": "kg/m^3"},
+               "attenuation":{"id":"attenuation",
+                              "name": "Attenuation",
+                              "units": "dB/cm/MHz"},
+               "specific_heat":{"id":"specific_heat",
+                                "name": "Specific Heat",
+                                "units": "J/kg/K"},
+               "thermal_conductivity":{"id":"thermal_conductivity",
+                                       "name": "Thermal Conductivity",
+                                       "units": "W/m/K"}}
+
 @dataclass
 class Material:
     id: str = "material"
@@ -15,24 +31,9 @@ class Material:
 
     @classmethod
     def param_info(cls, param_id: str):
-        INFO = {"sound_speed":{"id":"sound_speed",
-                               "name": "Speed of Sound",
-                               "units": "m/s"},
-                "density":{"id":"density",
-                           "name": "Density",
-                           "units": "kg/m^3"},
-                "attenuation":{"id":"attenuation",
-                               "name": "Attenuation",
-                               "units": "dB/cm/MHz"},
-                "specific_heat":{"id":"specific_heat",
-                                 "name": "Specific Heat",
-                                 "units": "J/kg/K"},
-                "thermal_conductivity":{"id":"thermal_conductivity",
-                                        "name": "Thermal Conductivity",
-                                        "units": "W/m/K"}}
-        if param_id not in INFO.keys():
+        if param_id not in _PARAM_INFO:
             raise ValueError(f"Parameter {param_id} not found.")
-        return INFO[param_id]
+        return _PARAM_INFO[param_id]
 
     def get_param(self, param_id: str):
         if param_id not in self.param_ids:
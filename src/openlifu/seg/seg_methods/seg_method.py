@@ -44,12 +44,15 @@ class SegmentationMethod:
         material_dict = self._material_indices(materials=materials)
         params = xa.Dataset()
         ref_mat = materials[self.ref_material]
-        for param_id in ref_mat.param_ids:
+        # The extra last column stays zero, and labels past the last material clip onto it
+        lut = np.zeros((len(ref_mat.param_ids), len(material_dict)+1), dtype=np.float32)
+        for material_id, material in materials.items():
+            lut[:, material_dict[material_id]] = [getattr(material, param_id) for param_id in ref_mat.param_ids]
+        # Gather every parameter volume in a single pass over the segmentation
+        param_data = np.take(lut, seg.data, axis=1, mode='clip')
+        for i, param_id in enumerate(ref_mat.param_ids):
             info = Material.param_info(param_id)
-            param = xa.DataArray(np.zeros(seg.shape), coords=seg.coords, attrs={"units": info["units"], "long_name": info["name"], "ref_value": ref_mat.get_param(param_id)})
-            for material_id, material in materials.items():
-                midx = material_dict[material_id]
-                param.data[seg.data == midx] = getattr(material, param_id)
+            param = xa.DataArray(param_data[i], coords=seg.coords, attrs={"units": info["units"], "long_name": info["name"], "ref_value": ref_mat.get_param(param_id)})
             params[param_id] = param
         params.attrs['ref_material'] = ref_mat
         return params
@@ -69,7 +72,7 @@ class SegmentationMethod:
        material_dict = self._material_indices()
        m_idx = material_dict[self.ref_material]
        sz = list(coords.sizes.values())
-       seg = xa.DataArray(np.full(sz, m_idx, dtype=int), coords=coords)
+       seg = xa.DataArray(np.full(sz, m_idx, dtype=np.uint8), coords=coords)
        return seg
 
     def to_dict(self):
@@ -6,6 +6,14 @@ import logging
 from openlifu.util.units import getunitconversion
 from openlifu.xdc import Transducer
 
+def _snap_extent(extent: Tuple[float, float], spacing: float, name: str = "extent"):
+    n_raw = (extent[1] - extent[0])/spacing
+    n = round(n_raw)
+    snapped = (float(extent[0]), float(extent[0] + n*spacing))
+    if abs(n_raw - n) > 1e-3*abs(n):
+        logging.warning(f"{name} {extent} does not evenly divide by spacing ({spacing}). Rounding to {snapped}.")
+    return snapped
+
 @dataclass
 class SimSetup:
     dims: Tuple[str, str, str] = ("lat", "ele", "ax")
@@ -34,21 +42,9 @@ class SimSetup:
             raise ValueError("z_extent must have length 2.")
         self.dims = tuple(self.dims)
         self.names = tuple(self.names)
-        nx = np.diff(self.x_extent)/self.spacing
-        x_extent = tuple(np.arange(2)*np.round(nx)*self.spacing + self.x_extent[0])
-        if ((0.5-np.abs((nx % 1) - 0.5))/ np.round(nx)) > 1e-3:
-            logging.warning(f"x_extent {self.x_extent} does not evenly divide by spacing ({self.spacing}). Rounding to {x_extent}.")
-        self.x_extent = x_extent
-        ny = np.diff(self.y_extent)/self.spacing
-        y_extent = tuple(np.arange(2)*np.round(ny)*self.spacing + self.y_extent[0])
-        if ((0.5-np.abs((ny % 1) - 0.5))/ np.round(ny)) > 1e-3:
-            logging.warning(f"y_extent {self.y_extent} does not evenly divide by spacing ({self.spacing}). Rounding to {y_extent}.")
-        self.y_extent = y_extent
-        nz = np.diff(self.z_extent)/self.spacing
-        z_extent = tuple(np.arange(2)*np.round(nz)*self.spacing + self.z_extent[0])
-        if ((0.5-np.abs((nz % 1) - 0.5))/ np.round(nz)) > 1e-3:
-            logging.warning(f"z_extent {self.z_extent} does not evenly divide by spacing ({self.spacing}). Rounding to {z_extent}.")
-        self.z_extent = z_extent
+        self.x_extent = _snap_extent(self.x_extent, self.spacing, name="x_extent")
+        self.y_extent = _snap_extent(self.y_extent, self.spacing, name="y_extent")
+        self.z_extent = _snap_extent(self.z_extent, self.spacing, name="z_extent")
 
     def get_coords(self, dims=None, units: Optional[str] = None):
         dims = self.dims if dims is None else dims
@@ -79,18 +75,32 @@ class SimSetup:
         frequency = arr.frequency if frequency is None else frequency
         delays = np.zeros(arr.numelements()) if delays is None else delays
         coords = self.get_coords(units="m")
-        cvals = [coords['lat'], coords['ele'], coords['ax'].sel(ax=slice(zmin, None))]
-        ndg = np.meshgrid(*cvals)
-        dists = [np.sqrt((ndg[0]-pos[0])**2 + (ndg[1]-pos[1])**2 + (ndg[2]-pos[2])**2) for pos in arr.get_positions(units="m")]
-        tof = [dist/self.c0 + delays[i] for i, dist in enumerate(dists)]
-        dtof = np.array(tof).max(axis=0) - np.array(tof).min(axis=0)
-        max_cycle_offset = dtof.max()*frequency
+        ax = coords['ax'].values
+        cvals = [coords['lat'].values.astype(np.float32), coords['ele'].values.astype(np.float32), ax[ax >= zmin].astype(np.float32)]
+        shape = tuple(len(cval) for cval in cvals)
+        # Accumulate the running min/max time of flight so only a few grids are ever live.
+        # The squared distance is separable per axis, so it is built by broadcasting 1D terms.
+        tof = np.empty(shape, dtype=np.float32)
+        tof_min = np.full(shape, np.inf, dtype=np.float32)
+        tof_max = np.full(shape, -np.inf, dtype=np.float32)
+        positions = arr.get_positions(units="m").astype(np.float32)
+        for pos, delay in zip(positions, np.asarray(delays, dtype=np.float32)):
+            np.add(((cvals[0]-pos[0])**2)[:, None, None], ((cvals[1]-pos[1])**2)[None, :, None], out=tof)
+            tof += ((cvals[2]-pos[2])**2)[None, None, :]
+            np.sqrt(tof, out=tof)
+            tof /= np.float32(self.c0)
+            tof += delay
+            np.minimum(tof_min, tof, out=tof_min)
+            np.maximum(tof_max, tof, out=tof_max)
+        dtof = tof_max - tof_min
+        max_cycle_offset = np.float64(dtof.max())*frequency
         return max_cycle_offset
 
     def get_max_distance(self, arr: Transducer, units: Optional[str] = None):
         units = self.units if units is None else units
         corners = self.get_corners(units=units)
-        distances = np.array([[el.distance_to_point(corner, units=units) for corner in corners.T] for el in arr.elements])
+        positions = arr.get_positions(transform=False, units=units)
+        distances = np.linalg.norm(positions[:, None, :] - corners.T[None, :, :], axis=2)
         max_distance = np.max(distances)
         return max_distance
 
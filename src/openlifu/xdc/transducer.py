@@ -119,12 +119,31 @@ class Transducer:
 
     def get_positions(self, transform=True, units=None):
         units = self.units if units is None else units
+        positions = self._get_element_values("x", "y", "z")
+        scl = {element_units: getunitconversion(element_units, units) for element_units in {element.units for element in self.elements}}
+        positions *= np.array([scl[element.units] for element in self.elements]).reshape(-1, 1)
         if transform:
             matrix = self.get_matrix(units=units)
-        else:
-            matrix = np.eye(4)
-        positions = [element.get_position(units=units, matrix=matrix) for element in self.elements]
-        return np.array(positions)
+            positions = np.dot(positions, matrix[:3, :3].T) + matrix[:3, 3]
+        return positions
+
+    def get_normals(self, transform=True):
+        az, el = self._get_element_values("az", "el").T
+        normals = np.stack([np.sin(az)*np.cos(el), -np.sin(el), np.cos(az)*np.cos(el)], axis=1)
+        if transform:
+            normals = np.dot(normals, self.matrix[:3, :3].T)
+        return normals
+
+    def angles_to_point(self, point, units=None, return_as="rad", transform=True):
+        units = self.units if units is None else units
+        v1 = point - self.get_positions(transform=transform, units=units)
+        v2 = self.get_normals(transform=transform)
+        v1 = v1 / np.linalg.norm(v1, axis=1, keepdims=True)
+        v2 = v2 / np.linalg.norm(v2, axis=1, keepdims=True)
+        theta = np.arcsin(np.linalg.norm(np.cross(v1, v2), axis=1))
+        if return_as == "deg":
+            theta = np.degrees(theta)
+        return theta
 
     def get_matrix(self, units=None):
         units = self.units if units is None else units
@@ -132,6 +151,10 @@ class Transducer:
         matrix[0:3, 3] *= getunitconversion(self.units, units)
         return matrix
 
+    def _get_element_values(self, *attrs):
+        values = [[getattr(element, attr) for attr in attrs] for element in self.elements]
+        return np.array(values, dtype=np.float64).reshape(-1, len(attrs))
+
     def get_unit_vectors(self, transform=True, scale=1, units=None):
         units = self.units if units is None else units
         unit_vectors = [
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from openlifu.io.ustx import NUM_CHANNELS, DelayProfile, PulseProfile, TxArray
+
+
+@pytest.fixture
+def make_array():
+    """Factory for a TxArray with two delay profiles and three pulse profiles configured."""
+    def _make_array(num_modules: int = 2) -> TxArray:
+        arr = TxArray(i2c_addresses=tuple(range(0x10, 0x10 + num_modules)))
+        num_elements = NUM_CHANNELS * arr.num_transmitters * num_modules
+        rng = np.random.default_rng(num_modules)
+        arr.add_delay_profile(DelayProfile(1, rng.uniform(0, 100e-6, num_elements)))
+        apodizations = (rng.uniform(size=num_elements) > 0.3).astype(int)
+        arr.add_delay_profile(DelayProfile(3, rng.uniform(0, 50, num_elements), apodizations, units='us'))
+        arr.add_pulse_profile(PulseProfile(1, 400e3, 3))
+        arr.add_pulse_profile(PulseProfile(2, 150e3, 100, duty_cycle=0.4, invert=True))
+        arr.add_pulse_profile(PulseProfile(4, 2e6, 1, duty_cycle=1.0))
+        return arr
+    return _make_array
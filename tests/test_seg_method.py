@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import numpy as np
+import xarray as xa
+
+from openlifu.seg.material import MATERIALS
+from openlifu.seg.seg_methods import Tissue, Water
+
+
+def test_map_params_zeroes_unmatched_labels():
+    method = Tissue()
+    num_materials = len(method.materials)
+    data = np.array([[0, 1, 2], [num_materials-1, num_materials, num_materials + 3]])
+    seg = xa.DataArray(data, coords={"x": np.arange(2), "y": np.arange(3)})
+    params = method._map_params(seg)
+    for param_id in method.materials[method.ref_material].param_ids:
+        expected = np.zeros(data.shape)
+        for i, material in enumerate(method.materials.values()):
+            expected[data == i] = getattr(material, param_id)
+        np.testing.assert_allclose(params[param_id].data, expected)
+
+
+def test_map_params_follows_the_materials_used():
+    method = Water()
+    materials = {"skull": MATERIALS["skull"], "water": MATERIALS["water"], "gel": MATERIALS["standoff"]}
+    seg = xa.DataArray(np.array([0, 1, 2]), coords={"x": np.arange(3)})
+    expected = [MATERIALS[material_id].sound_speed for material_id in ("skull", "water", "standoff")]
+    np.testing.assert_allclose(method._map_params(seg, materials=materials)["sound_speed"].data, expected)
+    method.materials = materials
+    np.testing.assert_allclose(method._map_params(seg)["sound_speed"].data, expected)
+    ref_params = method.ref_params(xa.Coordinates({"x": np.arange(2)}))
+    np.testing.assert_allclose(ref_params["sound_speed"].data, MATERIALS["water"].sound_speed)
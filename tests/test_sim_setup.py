@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import logging
+
+from openlifu.sim.sim_setup import _snap_extent
+
+
+def test_snap_extent_keeps_even_extents_quiet(caplog):
+    with caplog.at_level(logging.WARNING):
+        assert _snap_extent((-30., 30.), 1.0) == (-30., 30.)
+        assert _snap_extent((30., -30.), 1.0) == (30., -30.)
+    assert caplog.text == ""
+
+
+def test_snap_extent_warns_on_uneven_reversed_extents(caplog):
+    with caplog.at_level(logging.WARNING):
+        assert _snap_extent((30., -30.4), 1.0) == (30., -30.)
+    assert "does not evenly divide" in caplog.text
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import copy
+import json
+import logging
+import pickle
+
+import numpy as np
+
+from openlifu.io.ustx import (
+    NUM_CHANNELS,
+    DelayProfile,
+    PulseProfile,
+    Tx7332Registers,
+    calc_pulse_pattern,
+)
+
+
+def test_txarray_copy_and_pickle_after_get_registers(make_array):
+    arr = make_array()
+    regs = arr.get_registers(pack=True)
+    assert copy.deepcopy(arr).get_registers(pack=True) == regs
+    assert pickle.loads(pickle.dumps(arr)).get_registers(pack=True) == regs
+    json.dumps(regs)
+
+
+def test_txarray_get_registers_returns_copies(make_array):
+    arr = make_array()
+    regs = arr.get_registers(pack=True)
+    expected = copy.deepcopy(regs)
+    for module_regs in regs.values():
+        for tx_regs in module_regs:
+            for val in tx_regs.values():
+                if isinstance(val, list):
+                    val.clear()
+            tx_regs.clear()
+    regs.clear()
+    assert arr.get_registers(pack=True) == expected
+
+
+def test_txmodule_get_registers_returns_copies(make_array):
+    module = make_array(1).modules[0x10]
+    regs = module.get_registers(pack=True)
+    expected = copy.deepcopy(regs)
+    for tx_regs in regs:
+        for val in tx_regs.values():
+            if isinstance(val, list):
+                val.append(0)
+        tx_regs.clear()
+    assert module.get_registers(pack=True) == expected
+
+
+def test_txarray_readded_profile_follows_in_place_edits(make_array):
+    arr = make_array()
+    delay_profile = arr.get_delay_profile(1)
+    arr.add_delay_profile(DelayProfile(1, delay_profile.delays.copy(), delay_profile.apodizations.copy()))
+    before = arr.get_registers()
+    arr.get_delay_profile(1).delays[:] = 5e-6
+    after = arr.get_registers()
+    assert after != before
+    assert arr.get_registers(recompute=True) == after
+
+
+def make_transmitter() -> Tx7332Registers:
+    tx = Tx7332Registers()
+    tx.add_delay_profile(DelayProfile(1, np.arange(NUM_CHANNELS) * 1e-6))
+    tx.add_delay_profile(DelayProfile(2, np.arange(NUM_CHANNELS)[::-1] * 1e-6))
+    tx.add_pulse_profile(PulseProfile(1, 400e3, 3))
+    tx.add_pulse_profile(PulseProfile(2, 150e3, 100))
+    return tx
+
+
+def test_transmitter_data_registers_cannot_corrupt_cache():
+    tx = make_transmitter()
+    for profiles in ("active", "configured", "all"):
+        for pack_single in (False, True):
+            expected = copy.deepcopy(tx.get_registers(profiles, pack=True, pack_single=pack_single))
+            for regs in (tx.get_registers(profiles, pack=True, pack_single=pack_single),
+                         tx.get_delay_data_registers(pack=True, pack_single=pack_single),
+                         tx.get_pulse_data_registers(pack=True, pack_single=pack_single)):
+                for val in regs.values():
+                    if isinstance(val, list):
+                        val.append(0)
+            assert tx.get_registers(profiles, pack=True, pack_single=pack_single) == expected
+
+
+def test_transmitter_cache_follows_profile_edits():
+    tx = make_transmitter()
+    before = tx.get_registers("configured")
+    tx.get_delay_profile(1).delays[0] = 5e-6
+    tx.get_pulse_profile(2).frequency = 200e3
+    after = tx.get_registers("configured")
+    fresh = Tx7332Registers(
+        _delay_profiles_list=list(tx._delay_profiles_list),
+        _pulse_profiles_list=list(tx._pulse_profiles_list),
+        active_delay_profile=tx.active_delay_profile,
+        active_pulse_profile=tx.active_pulse_profile,
+    )
+    assert after != before
+    assert after == fresh.get_registers("configured")
+
+
+def test_txmodule_and_transmitters_agree_after_in_place_edit(make_array):
+    module = make_array(1).modules[0x10]
+    before = module.get_registers()
+    module.get_delay_profile(1).delays[0] = 50e-6
+    module.get_pulse_profile(2).cycles = 20
+    after = module.get_registers()
+    assert after != before
+    assert [tx.get_registers() for tx in module.transmitters] == after
+    assert module.get_registers(recompute=True) == after
+
+
+def test_calc_pulse_pattern_returns_fresh_lists():
+    pattern = calc_pulse_pattern(400e3, 0.66)
+    for key in ("levels", "lengths", "t", "y"):
+        assert isinstance(pattern[key], list)
+    expected = copy.deepcopy(pattern)
+    pattern["t"].append(0.0)
+    pattern["y"][0] = 5
+    pattern["levels"].clear()
+    assert calc_pulse_pattern(400e3, 0.66) == expected
+    assert len(expected["t"]) == len(expected["y"]) == sum(expected["lengths"]) + 2*len(expected["lengths"])
+
+
+def test_calc_pulse_pattern_warns_on_every_call(caplog):
+    for _ in range(2):
+        caplog.clear()
+        with caplog.at_level(logging.WARNING):
+            calc_pulse_pattern(400e3, 0.01)
+        assert "Duty cycle too short" in caplog.text
@@ -0,0 +1,278 @@
+"""Checks the register builders against a plain reimplementation of the original per-channel loops."""
+from __future__ import annotations
+
+import copy
+import logging
+import pickle
+
+import numpy as np
+import pytest
+
+from openlifu.io import ustx
+from openlifu.io.ustx import DEFAULT_CLK_FREQ, NUM_CHANNELS, DelayProfile, PulseProfile, calc_pulse_pattern
+from openlifu.util.units import getunitconversion
+
+M = ustx.MAX_PATTERN_PERIOD_LENGTH
+
+
+def ref_set_register_value(reg_value, value, lsb=0, width=None):
+    if width is None:
+        width = ustx.REGISTER_WIDTH - lsb
+    mask = (1 << width) - 1
+    if value < 0 or value > mask:
+        raise ValueError(f"Value {value} does not fit in {width} bits")
+    return (reg_value & ~(mask << lsb)) | ((int(value) & mask) << lsb)
+
+
+def ref_delay_location(channel, profile):
+    channel_map = ustx.DELAY_CHANNEL_MAP[channel]
+    return ustx.ADDRESSES_DELAY_DATA[0] + (profile-1)*ustx.DELAY_PROFILE_OFFSET + channel_map['row'], channel_map['lsb']
+
+
+def ref_pattern_location(period, profile):
+    period_map = ustx.PATTERN_MAP[period]
+    address = ustx.ADDRESSES_PATTERN_DATA[0] + (profile-1)*ustx.PATTERN_PROFILE_OFFSET + period_map['row']
+    return address, period_map['lsb_lvl'], period_map['lsb_period']
+
+
+def ref_pack_registers(regs, pack_single=False):
+    packed = {}
+    last_addr = burst_addr = -255
+    for addr in sorted(regs):
+        if addr == last_addr+1 and burst_addr in packed:
+            packed[burst_addr].append(regs[addr])
+        else:
+            packed[addr] = [regs[addr]]
+            burst_addr = addr
+        last_addr = addr
+    if not pack_single:
+        packed = {addr: val[0] if len(val) == 1 else val for addr, val in packed.items()}
+    return packed
+
+
+def ref_split_samples(samples):
+    lengths = []
+    while samples > 0:
+        if samples > M+2:
+            if samples == M+3:
+                lengths.append(M-1)
+                samples -= M+1
+            else:
+                lengths.append(M)
+                samples -= M+2
+        else:
+            lengths.append(samples-2)
+            samples = 0
+    return lengths
+
+
+def ref_pulse_pattern(frequency, duty_cycle, bf_clk=DEFAULT_CLK_FREQ):
+    for clk_div_n in range(6):
+        clk_n = bf_clk / (2**clk_div_n)
+        period_samples = int(clk_n / frequency)
+        first_half = int(period_samples / 2)
+        second_half = period_samples - first_half
+        first_on = max(2, int(first_half * duty_cycle))
+        first_off = first_half - first_on
+        second_on = max(2, int(second_half * duty_cycle))
+        second_off = second_half - second_on
+        if 0 < first_off < 2:
+            first_off = 0
+            first_on = first_half
+        if second_off > 0 and first_off < 2:
+            second_off = 0
+            second_on = second_half
+        levels, lengths = [], []
+        for level, samples in zip([1, 0, -1, 0], [first_on, first_off, second_on, second_off]):
+            run = ref_split_samples(samples)
+            lengths.extend(run)
+            levels.extend([level]*len(run))
+        if len(levels) <= ustx.MAX_PATTERN_PERIODS:
+            t = (np.arange(np.sum(np.array(lengths)+2))*(1/clk_n)).tolist()
+            y = np.concatenate([[yi]*(ni+2) for yi, ni in zip(levels, lengths)]).tolist()
+            return {'levels': levels, 'lengths': lengths, 'clk_div_n': clk_div_n, 't': t, 'y': y}
+    raise ValueError("Pattern requires too many periods")
+
+
+def ref_delay_data(delay_profile, bf_clk, pack, pack_single):
+    regs = {}
+    for channel in range(1, NUM_CHANNELS+1):
+        address, lsb = ref_delay_location(channel, delay_profile.profile)
+        value = int(delay_profile.delays[channel-1] * getunitconversion(delay_profile.units, 's') * bf_clk)
+        regs[address] = ref_set_register_value(regs.get(address, 0), value, lsb=lsb, width=ustx.DELAY_WIDTH)
+    return ref_pack_registers(regs, pack_single) if pack else regs
+
+
+def ref_pulse_data(pulse_profile, bf_clk, pack, pack_single):
+    pattern = ref_pulse_pattern(pulse_profile.frequency, pulse_profile.duty_cycle, bf_clk)
+    level_lut = {-1: 0b01, 0: 0b00, 1: 0b10}
+    periods = [(level_lut[level], length) for level, length in zip(pattern['levels'], pattern['lengths'])]
+    if len(periods) < ustx.MAX_PATTERN_PERIODS:
+        periods.append((0b111, 0))
+    regs = {}
+    for i, (level, length) in enumerate(periods):
+        address, lsb_lvl, lsb_length = ref_pattern_location(i+1, pulse_profile.profile)
+        reg = ref_set_register_value(regs.get(address, 0), level, lsb=lsb_lvl, width=ustx.PATTERN_LEVEL_WIDTH)
+        regs[address] = ref_set_register_value(reg, length, lsb=lsb_length, width=ustx.PATTERN_LENGTH_WIDTH)
+    return ref_pack_registers(regs, pack_single) if pack else regs
+
+
+def ref_pulse_control(pulse_profile, bf_clk):
+    clk_div_n = ref_pulse_pattern(pulse_profile.frequency, pulse_profile.duty_cycle, bf_clk)['clk_div_n']
+    if pulse_profile.cycles > ustx.MAX_REPEAT+1:
+        repeat, elastic_mode = 0, 1
+        elastic_repeat = int(pulse_profile.cycles * bf_clk / pulse_profile.frequency / 16)
+    else:
+        repeat, elastic_mode, elastic_repeat = pulse_profile.cycles-1, 0, 0
+    reg_mode = ref_set_register_value(0x02000003, clk_div_n, lsb=3, width=3)
+    reg_mode = ref_set_register_value(reg_mode, int(pulse_profile.invert), lsb=6, width=1)
+    reg_repeat = ref_set_register_value(0, repeat, lsb=1, width=5)
+    reg_repeat = ref_set_register_value(reg_repeat, pulse_profile.tail_count, lsb=6, width=5)
+    reg_repeat = ref_set_register_value(reg_repeat, elastic_mode, lsb=11, width=1)
+    reg_repeat = ref_set_register_value(reg_repeat, elastic_repeat, lsb=12, width=16)
+    reg_pat_sel = ref_set_register_value(0, pulse_profile.profile-1, lsb=0, width=6)
+    return {ustx.ADDRESS_PATTERN_MODE: reg_mode,
+            ustx.ADDRESS_PATTERN_REPEAT: reg_repeat,
+            ustx.ADDRESS_PATTERN_SEL_G1: reg_pat_sel,
+            ustx.ADDRESS_PATTERN_SEL_G2: reg_pat_sel}
+
+
+def ref_transmitter_registers(delay_profiles, pulse_profiles, active_delay, active_pulse, profiles, pack, pack_single, bf_clk):
+    delay_by_id = {dp.profile: dp for dp in delay_profiles}
+    pulse_by_id = {pp.profile: pp for pp in pulse_profiles}
+    active_dp = delay_by_id[active_delay]
+    apod_register = 0
+    for i, apod in enumerate(active_dp.apodizations):
+        apod_register = ref_set_register_value(apod_register, 1-int(apod), lsb=i, width=1)
+    delay_sel = ref_set_register_value(0, active_delay-1, lsb=12, width=4)
+    delay_sel = ref_set_register_value(delay_sel, active_delay-1, lsb=28, width=4)
+    registers = {addr: 0x0 for addr in ustx.ADDRESSES_GLOBAL}
+    registers.update({ustx.ADDRESS_DELAY_SEL: delay_sel, ustx.ADDRESS_APODIZATION: apod_register})
+    registers.update(ref_pulse_control(pulse_by_id[active_pulse], bf_clk))
+    if profiles == "active":
+        delay_data = ref_delay_data(active_dp, bf_clk, pack, pack_single)
+        pulse_data = ref_pulse_data(pulse_by_id[active_pulse], bf_clk, pack, pack_single)
+    else:
+        delay_data = {addr: 0x0 for addr in ustx.ADDRESSES_DELAY_DATA} if profiles == "all" else {}
+        pulse_data = {addr: 0x0 for addr in ustx.ADDRESSES_PATTERN_DATA} if profiles == "all" else {}
+        for dp in delay_profiles:
+            delay_data.update(ref_delay_data(dp, bf_clk, pack, pack_single))
+        for pp in pulse_profiles:
+            pulse_data.update(ref_pulse_data(pp, bf_clk, pack, pack_single))
+    if pack:
+        delay_data = ref_pack_registers(delay_data, pack_single)
+        pulse_data = ref_pack_registers(pulse_data, pack_single)
+    registers.update(delay_data)
+    registers.update(pulse_data)
+    return registers
+
+
+def ref_array_registers(arr, profiles, pack, pack_single):
+    """Registers of every transmitter, built from the array-level profiles only."""
+    delay_profiles = [arr.get_delay_profile(p) for p in arr.configured_delay_profiles()]
+    pulse_profiles = [arr.get_pulse_profile(p) for p in arr.configured_pulse_profiles()]
+    registers = {}
+    for m, (addr, module) in enumerate(arr.modules.items()):
+        registers[addr] = []
+        for t in range(module.num_transmitters):
+            start = (m*module.num_transmitters + t)*NUM_CHANNELS
+            channels = np.arange(start, start+NUM_CHANNELS)
+            tx_delays = [DelayProfile(dp.profile, np.array(dp.delays)[channels].tolist(), np.array(dp.apodizations)[channels].tolist(), dp.units)
+                         for dp in delay_profiles]
+            registers[addr].append(ref_transmitter_registers(tx_delays, pulse_profiles, arr.active_delay_profile, arr.active_pulse_profile,
+                                                             profiles, pack, pack_single, arr.bf_clk))
+    return registers
+
+
+def assert_matches_reference(arr):
+    for profiles in ("active", "configured", "all"):
+        for pack in (False, True):
+            for pack_single in (False, True):
+                expected = ref_array_registers(arr, profiles, pack, pack_single)
+                assert arr.get_registers(profiles, pack=pack, pack_single=pack_single) == expected, (profiles, pack, pack_single)
+
+
+@pytest.mark.parametrize("num_modules", [1, 2, 3])
+def test_array_registers_match_reference(make_array, num_modules):
+    arr = make_array(num_modules)
+    assert_matches_reference(arr)
+    arr.activate_delay_profile(3)
+    arr.activate_pulse_profile(2)
+    assert_matches_reference(arr)
+
+
+@pytest.mark.parametrize("num_modules", [1, 2, 3])
+def test_data_registers_match_reference(make_array, num_modules):
+    arr = make_array(num_modules)
+    for pack in (False, True):
+        for pack_single in (False, True):
+            for profile in arr.configured_delay_profiles():
+                expected = ref_array_registers(arr, "configured", False, False)
+                regs = arr.get_delay_data_registers(profile, pack=pack, pack_single=pack_single)
+                for addr, module_regs in regs.items():
+                    for tx_regs, tx_expected in zip(module_regs, expected[addr]):
+                        data = {a: tx_expected[a] for a in ustx.ADDRESSES_DELAY_DATA if a in tx_expected
+                                and (a - ustx.ADDRESSES_DELAY_DATA[0]) // ustx.DELAY_PROFILE_OFFSET == profile-1}
+                        assert tx_regs == (ref_pack_registers(data, pack_single) if pack else data)
+            for profile in arr.configured_pulse_profiles():
+                expected = ref_pulse_data(arr.get_pulse_profile(profile), arr.bf_clk, pack, pack_single)
+                regs = arr.get_pulse_data_registers(profile, pack=pack, pack_single=pack_single)
+                assert all(tx_regs == expected for module_regs in regs.values() for tx_regs in module_regs)
+
+
+def test_register_cache_follows_array_changes(make_array):
+    arr = make_array(2)
+    num_elements = NUM_CHANNELS * arr.num_transmitters * 2
+    assert_matches_reference(arr)
+    arr.add_delay_profile(DelayProfile(1, np.linspace(0, 20e-6, num_elements)))
+    arr.add_delay_profile(DelayProfile(5, np.linspace(20e-6, 0, num_elements)))
+    arr.add_pulse_profile(PulseProfile(1, 500e3, 10))
+    assert_matches_reference(arr)
+    arr.remove_delay_profile(3)
+    arr.remove_pulse_profile(2)
+    assert_matches_reference(arr)
+    arr.activate_delay_profile(5)
+    arr.activate_pulse_profile(4)
+    assert_matches_reference(arr)
+    before = arr.get_registers("configured")
+    arr.get_delay_profile(5).delays[:] = 7e-6
+    arr.get_pulse_profile(4).frequency = 1e6
+    after = arr.get_registers("configured")
+    assert after != before
+    assert after == ref_array_registers(arr, "configured", False, False)
+    assert arr.get_registers("configured", recompute=True) == after
+    assert_matches_reference(arr)
+
+
+def test_array_registers_survive_copy_and_pickle(make_array):
+    arr = make_array(3)
+    arr.get_registers("all", pack=True)
+    for clone in (copy.deepcopy(arr), pickle.loads(pickle.dumps(arr))):
+        assert_matches_reference(clone)
+        clone.activate_delay_profile(3)
+        assert_matches_reference(clone)
+        assert arr.active_delay_profile == 1
+    assert_matches_reference(arr)
+
+
+def test_split_samples_matches_reference():
+    for samples in range(-3, 20*(M+2)):
+        assert ustx._split_samples(samples) == ref_split_samples(samples), samples
+
+
+def test_pulse_pattern_matches_reference():
+    logging.disable(logging.WARNING)
+    try:
+        for frequency in np.linspace(100e3, 3e6, 40):
+            for duty_cycle in (0.01, 0.3, 0.5, 0.66, 0.95, 1.0):
+                for bf_clk in (DEFAULT_CLK_FREQ, 10e6):
+                    try:
+                        expected = ref_pulse_pattern(frequency, duty_cycle, bf_clk)
+                    except ValueError:
+                        with pytest.raises(ValueError):
+                            calc_pulse_pattern(frequency, duty_cycle, bf_clk)
+                        continue
+                    assert calc_pulse_pattern(frequency, duty_cycle, bf_clk) == expected, (frequency, duty_cycle, bf_clk)
+    finally:
+        logging.disable(logging.NOTSET)
+